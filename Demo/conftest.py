@@ -0,0 +1,14 @@
+"""
+pytest configuration for Peregrine Speak.
+
+Puts the src directory on the import path once, at collection time, so
+tests can import peregrine_speak directly.
+"""
+
+import sys
+from pathlib import Path
+
+SRC_DIR = str(Path(__file__).resolve().parent / "src")
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
@@ -2,7 +2,9 @@
 Main application class for Peregrine Speak.
 """
 
+import os
 import sys
+import logging
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon, QFont
@@ -22,7 +24,7 @@ class PeregrineApp:
         self.setup_application()
         
         # Initialize TTS engine
-        self.tts_engine = KokoroEngine()
+        self.tts_engine = KokoroEngine.instance()
         
         # Initialize screens
         self.home_screen = None
@@ -33,6 +35,18 @@ class PeregrineApp:
     
     def setup_application(self):
         """Set up application-wide settings."""
+        # Log level comes from PEREGRINE_LOGLEVEL (e.g. DEBUG), INFO by default
+        level_name = os.environ.get("PEREGRINE_LOGLEVEL", "INFO").upper()
+        level = logging.getLevelName(level_name)
+        valid = isinstance(level, int)  # Unknown names map to "Level <name>"
+        logging.basicConfig(
+            level=level if valid else logging.INFO,
+            format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+        )
+        if not valid:
+            logging.getLogger(__name__).warning(
+                f"Unknown PEREGRINE_LOGLEVEL {level_name!r}, using INFO")
+        
         self.app.setApplicationName("Peregrine Speak")
         self.app.setApplicationVersion("1.0.0")
         self.app.setOrganizationName("Peregrine AI")
@@ -18,24 +18,32 @@ Dependencies:
 - torch: Neural network backend for AI voice models
 - pygame: Audio playback system
 - numpy: Audio data processing
-- scipy: Audio file I/O (optional)
 """
 
 import os
+import re
+import gc
+import sys
+import ctypes
+import asyncio
+import contextlib
+import logging
 import threading
-import queue
-import tempfile
-from typing import Optional, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Iterator, Tuple, AsyncIterator
 import numpy as np
 import torch
 
+logger = logging.getLogger(__name__)
+
 # Import Kokoro TTS - The core AI voice synthesis engine
 try:
     from kokoro import KModel, KPipeline
     KOKORO_AVAILABLE = True
-    print("✓ Kokoro TTS successfully imported")
+    logger.debug("✓ Kokoro TTS successfully imported")
 except ImportError as e:
-    print(f"✗ Warning: Kokoro TTS not available: {e}")
+    logger.warning(f"✗ Warning: Kokoro TTS not available: {e}")
     KOKORO_AVAILABLE = False
 
 # Import pygame for audio playback
@@ -44,15 +52,151 @@ try:
     PYGAME_AVAILABLE = True
 except ImportError:
     PYGAME_AVAILABLE = False
-    print("✗ Warning: pygame not available")
+    logger.warning("✗ Warning: pygame not available")
+
+# torch.compile the models (set PEREGRINE_COMPILE=0 to run eagerly)
+COMPILE_ENABLED = (os.environ.get("PEREGRINE_COMPILE", "1") != "0"
+                   and hasattr(torch, "compile"))
+
+# Reduced-precision inference (set PEREGRINE_FP16=0 to force FP32)
+FP16_ENABLED = os.environ.get("PEREGRINE_FP16", "1") != "0"
+
+# Dynamic int8 quantization of the CPU model (set PEREGRINE_INT8_CPU=1)
+INT8_CPU_ENABLED = os.environ.get("PEREGRINE_INT8_CPU", "0") == "1"
+
+# Memory-map checkpoints on load (set PEREGRINE_MMAP=0 to read them in full)
+MMAP_LOAD_ENABLED = os.environ.get("PEREGRINE_MMAP", "1") != "0"
+
+# Stack every voice pack into one device tensor in the background after
+# start-up (set PEREGRINE_VOICE_TABLE=1; by default packs load on first use)
+VOICE_TABLE_ENABLED = os.environ.get("PEREGRINE_VOICE_TABLE", "0") == "1"
 
-# Import scipy for advanced audio processing (optional)
+# Mixer buffer in samples (~85ms at 24kHz) to avoid underruns
 try:
-    import scipy.io.wavfile
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
-    print("✗ Warning: scipy not available")
+    MIXER_BUFFER = int(os.environ.get("PEREGRINE_MIXER_BUFFER", "2048"))
+    if MIXER_BUFFER <= 0:
+        raise ValueError(MIXER_BUFFER)
+except ValueError:
+    logger.warning("Invalid PEREGRINE_MIXER_BUFFER %r, using 2048",
+                   os.environ["PEREGRINE_MIXER_BUFFER"])
+    MIXER_BUFFER = 2048
+
+# Short pipeline segments are merged into one model call up to this many
+# phonemes (KModel accepts at most 510 per call)
+BATCH_PHONEMES = 256
+
+# Texts longer than this are split into sentences and synthesized one by one
+SENTENCE_SPLIT_LENGTH = 120
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Progressive frame sizes for stream(): the first frame goes out after
+# 20ms of audio, later frames double up to 200ms, and a 10ms tail is held
+# back so the last frame can be flagged final
+STREAM_FIRST_FRAME_MS = 20
+STREAM_MAX_FRAME_MS = 200
+STREAM_TAIL_MS = 10
+
+# Phonemes of a typical sentence, used to warm up compiled models
+WARMUP_PHONEMES = "hələʊ! ðɪs ɪz ə ʃˈɔːt sˈɛntəns juːzd tə wˈɔːm ʌp ðə mˈɒdəl."
+
+
+def _cpu_supports_bf16() -> bool:
+    """Check whether the CPU has native BF16 support (e.g. AVX-512 BF16)."""
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except Exception:
+        return False
+
+
+_mmap_lock = threading.Lock()
+_mmap_depth = 0          # Engine loads currently inside _mmap_loads()
+_mmap_previous = False   # torch's mmap load setting before the first one
+
+
+@contextlib.contextmanager
+def _mmap_loads():
+    """
+    Memory-map checkpoints that torch.load reads inside this block.
+    
+    Kokoro calls torch.load itself, so there's no mmap argument to pass;
+    torch's default load setting is switched on for the engine's own loads
+    and restored once the last overlapping load finishes, so other loads
+    in the process keep their usual behaviour.
+    """
+    global _mmap_depth, _mmap_previous
+    try:
+        from torch.utils.serialization import config as load_config
+    except ImportError:
+        load_config = None  # PyTorch < 2.5 has no default mmap setting
+    if not MMAP_LOAD_ENABLED or not hasattr(load_config, "load"):
+        yield
+        return
+        
+    with _mmap_lock:
+        if _mmap_depth == 0:
+            _mmap_previous = load_config.load.mmap
+            load_config.load.mmap = True
+        _mmap_depth += 1
+    try:
+        yield
+    finally:
+        with _mmap_lock:
+            _mmap_depth -= 1
+            if _mmap_depth == 0:
+                load_config.load.mmap = _mmap_previous
+
+
+def _cuda_autocast_dtype() -> torch.dtype:
+    """Pick BF16 on GPUs that support it (Ampere and newer), else FP16."""
+    try:
+        if torch.cuda.is_bf16_supported():
+            return torch.bfloat16
+    except Exception:
+        pass
+    return torch.float16
+
+
+class _LatestSlot:
+    """
+    Single-slot hand-off between speak() and the worker thread.
+    
+    Only the latest request matters (a new speak() replaces whatever is
+    pending), so instead of an unbounded queue a put simply overwrites the
+    slot and wakes the worker.
+    """
+    
+    _EMPTY = object()
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._pending = self._EMPTY
+        
+    def put(self, item):
+        """Replace any pending item with this one and wake the worker."""
+        with self._lock:
+            self._pending = item
+            self._event.set()
+            
+    def get(self):
+        """Block until an item is available, then take it."""
+        while True:
+            self._event.wait()
+            with self._lock:
+                self._event.clear()
+                if self._pending is not self._EMPTY:
+                    item, self._pending = self._pending, self._EMPTY
+                    return item
+                    
+    def clear(self):
+        """Drop the pending item, if any."""
+        with self._lock:
+            self._pending = self._EMPTY
+            self._event.clear()
+            
+    def empty(self) -> bool:
+        """Check whether no item is pending."""
+        return self._pending is self._EMPTY
 
 
 class Voice:
@@ -101,14 +245,39 @@ class KokoroEngine:
     The engine supports 18 high-quality AI voices across American and
     British English variants, with both male and female options.
     
+    The engine is a process-wide singleton so the model weights are only
+    loaded once; constructing it again returns the existing instance.
+    
     Example Usage:
-        engine = KokoroEngine()
+        engine = KokoroEngine.instance()
         if engine.is_initialized:
             voices = engine.get_available_voices()
             engine.set_voice(voices[0].name)
             engine.speak("Hello world!", speed=1.0)
     """
     
+    _instance = None                       # Process-wide engine
+    _instance_lock = threading.RLock()     # Guards singleton construction
+    
+    def __new__(cls):
+        """Return the existing engine instead of creating another one."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._constructed = False
+            return cls._instance
+            
+    @classmethod
+    def instance(cls) -> 'KokoroEngine':
+        """
+        Get the process-wide engine, creating it on first use.
+        
+        Returns:
+            KokoroEngine: The shared engine instance
+        """
+        with cls._instance_lock:
+            return cls()
+            
     def __init__(self):
         """
         Initialize the Kokoro TTS engine.
@@ -119,32 +288,59 @@ class KokoroEngine:
         - Sets up audio playback system
         - Starts background worker thread
         - Configures voice library
+        
+        Does nothing if the shared instance is already set up.
         """
+        if self._constructed:
+            return
+        self._constructed = True
+        
         # Voice and state management
         self.available_voices = []          # List of Voice objects
+        self._voice_by_name = {}            # Voice lookup by display name
+        self._voice_by_code = {}            # Voice lookup by Kokoro code
         self.current_voice = None           # Currently selected Voice
+        self._current_binding = None        # (Voice, pipeline), set as one
         self.is_initialized = False         # Engine initialization status
         self.is_speaking = False           # Current speech state
         self.is_paused = False             # Pause state
+        self._generation = 0               # Bumped by each speak()/stop()
+        self._cleaned_up = False           # Set by the first cleanup()
         
         # Threading and queue management
-        self.speech_queue = queue.Queue()  # Queue for TTS requests
+        self.speech_queue = _LatestSlot()  # Latest pending TTS request
         self.worker_thread = None          # Background synthesis thread
         self._stop_event = threading.Event()  # Thread shutdown signal
+        self._done = threading.Event()     # Set while no speech is pending
+        self._done.set()
+        self._idle_lock = threading.Lock()  # Orders queueing vs going idle
         
         # Kokoro AI components
         self.models = {}                   # Dictionary of loaded AI models
         self.pipelines = {}                # Language processing pipelines
         self.cuda_available = False        # GPU availability flag
+        self._model_lock = threading.Lock()   # Serializes model forwards
+        self._gpu_autocast_dtype = torch.float16  # Set by _configure_torch
+        self._cpu_autocast = False         # CPU BF16 autocast, ditto
+        self._voice_pack_cache: Dict[str, torch.Tensor] = {}  # By voice code
+        self._warmup_thread = None         # Background compile warm-up
+        self._copy_stream = None           # CUDA stream for input uploads
+        self._ids_staging = None           # Pinned host buffer for uploads
+        self._ids_uploaded = None          # Event: staging buffer is free
+        self._phoneme_cache = None         # (text, voice code, chunks)
+        self._voice_table = None           # All voice packs, stacked
+        self._voice_index = {}             # Voice code -> row in the table
+        self._voice_load_lock = threading.Lock()  # Guards pipeline.voices
         
         # Audio configuration
         self.sample_rate = 24000           # Kokoro uses 24kHz audio
         self.current_audio = None          # Current audio buffer
         self.audio_position = 0            # Playback position
-        
-        # Initialize pygame mixer for audio playback
-        if PYGAME_AVAILABLE:
-            pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=1)
+        self._channel = None               # Mixer channel chunks stream to
+        self._channel_end = 0.0            # Monotonic time channel drains
+        self._queued_length = 0.0          # Seconds of audio in queue slot
+        self._paused_at = 0.0              # Monotonic time of last pause
+        self._playback_wake = threading.Event()  # Set on stop/resume
         
         # Start the initialization process
         self.initialize_engine()
@@ -156,61 +352,271 @@ class KokoroEngine:
         This method performs the following initialization steps:
         1. Check for Kokoro availability
         2. Detect CUDA/GPU support
-        3. Load AI models (CPU and optionally GPU)
-        4. Initialize language processing pipelines
-        5. Set up voice library
-        6. Start background worker thread
+        3. Load AI models (CPU and optionally GPU), initialize language
+           processing pipelines and the audio mixer concurrently
+        4. Set up voice library
+        5. Start background worker thread
         
         Returns:
             bool: True if initialization successful, False otherwise
         """
         try:
             if not KOKORO_AVAILABLE:
-                print("❌ Kokoro TTS not available, cannot initialize")
+                logger.error("❌ Kokoro TTS not available, cannot initialize")
                 return False
                 
             # Check CUDA availability for GPU acceleration
             self.cuda_available = torch.cuda.is_available()
-            print(f"🔍 CUDA available: {self.cuda_available}")
-            
-            # Initialize Kokoro AI models
-            # CPU model is always loaded as fallback
-            self.models = {
-                'cpu': KModel().to('cpu').eval()
-            }
+            logger.info(f"🔍 CUDA available: {self.cuda_available}")
+            self._configure_torch()
             
-            # Load GPU model if CUDA is available
-            if self.cuda_available:
-                try:
-                    self.models['gpu'] = KModel().to('cuda').eval()
-                    print("🚀 GPU model loaded successfully")
-                except Exception as e:
-                    print(f"⚠️ Failed to load GPU model: {e}")
-                    self.cuda_available = False
-            
-            # Initialize pipelines for American and British English
-            self.pipelines = {
-                'a': KPipeline(lang_code='a', model=False),  # American
-                'b': KPipeline(lang_code='b', model=False)   # British
-            }
+            # Model loads, pipeline setup and mixer init are independent
+            # and I/O bound, so run them side by side
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                audio_future = executor.submit(self._init_audio)
+                # CPU model is always loaded as fallback
+                cpu_future = executor.submit(self._load_model, 'cpu')
+                gpu_future = (executor.submit(self._load_model, 'cuda')
+                              if self.cuda_available else None)
+                # Pipelines for American and British English
+                pipeline_futures = {
+                    lang_code: executor.submit(
+                        KPipeline, lang_code=lang_code, model=False)
+                    for lang_code in ('a', 'b')
+                }
+                
+                # Initialize Kokoro AI models
+                self.models = {'cpu': cpu_future.result()}
+                
+                # Use the GPU model if CUDA is available
+                if gpu_future is not None:
+                    try:
+                        self.models['gpu'] = gpu_future.result()
+                        self._copy_stream = torch.cuda.Stream()
+                        self._ids_uploaded = torch.cuda.Event()
+                        logger.info("🚀 GPU model loaded successfully")
+                    except Exception as e:
+                        logger.warning(f"⚠️ Failed to load GPU model: {e}")
+                        self.cuda_available = False
+                        
+                self.pipelines = {
+                    lang_code: future.result()
+                    for lang_code, future in pipeline_futures.items()
+                }
+                audio_future.result()
             
             # Set up the voice library with all available voices
             self.setup_kokoro_voices()
+            if VOICE_TABLE_ENABLED:
+                threading.Thread(target=self._build_voice_table,
+                                 daemon=True).start()
             
             # Start background worker thread for audio processing
             self.start_worker_thread()
             
+            # Pay the compile cost now rather than on the first speak()
+            if COMPILE_ENABLED:
+                self._warmup_thread = threading.Thread(
+                    target=self._warmup_models, daemon=True)
+                self._warmup_thread.start()
+            
             self.is_initialized = True
-            print("✅ Kokoro TTS Engine initialized successfully")
+            logger.info("✅ Kokoro TTS Engine initialized successfully")
             return True
             
         except Exception as e:
-            print(f"❌ Failed to initialize Kokoro TTS Engine: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ Failed to initialize Kokoro TTS Engine: {e}")
             self.is_initialized = False
             return False
             
+    def _configure_torch(self):
+        """
+        Apply process-wide PyTorch settings before any model runs.
+        
+        On CPU, inference uses half the cores so it doesn't starve the Qt
+        event loop and the audio thread. On GPU, TF32 matmuls are allowed
+        and cudnn autotuning stays off: every chunk has a different length,
+        so benchmark mode would re-tune for nearly every forward pass.
+        
+        The autocast precision for each device is resolved here once, as
+        _autocast runs for every chunk's forward pass.
+        """
+        self._cpu_autocast = FP16_ENABLED and _cpu_supports_bf16()
+        if self.cuda_available:
+            self._gpu_autocast_dtype = _cuda_autocast_dtype()
+            torch.backends.cudnn.benchmark = False
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+        else:
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // 2))
+            
+    def _init_audio(self):
+        """
+        Initialize the pygame mixer and the channel audio streams to.
+        
+        Without an audio device (e.g. a headless CI box) the engine stays
+        usable for stream(), synthesize_batch() and the request pool; only
+        playback is unavailable.
+        """
+        if not PYGAME_AVAILABLE:
+            return
+            
+        try:
+            # Fixed format (no allowed changes) so int16 mono buffers can be
+            # passed through as-is
+            pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=1,
+                              buffer=MIXER_BUFFER, devicename=None,
+                              allowedchanges=0)
+            pygame.mixer.set_num_channels(4)
+            self._channel = pygame.mixer.Channel(0)
+        except Exception as e:
+            logger.warning(f"⚠️ Audio playback unavailable: {e}")
+            self._channel = None
+            
+    def _load_model(self, device: str):
+        """
+        Load a Kokoro model onto a device and prepare it for inference.
+        
+        The checkpoint is memory-mapped where PyTorch supports it, so warm
+        starts read the weights from the page cache instead of copying the
+        whole file into a buffer first.
+        
+        Args:
+            device: 'cpu' or 'cuda'
+            
+        Returns:
+            KModel ready for synthesis
+        """
+        with _mmap_loads():
+            model = KModel()
+        model = model.to(device).eval()
+        for param in model.parameters():
+            param.requires_grad_(False)
+        if device == 'cpu':
+            model = self._quantize_cpu_model(model)
+            self._compile_model(model, "reduce-overhead")
+        else:
+            self._compile_model(model, "max-autotune")
+        return model
+        
+    def _quantize_cpu_model(self, model):
+        """
+        Convert the CPU model's Linear/LSTM weights to int8.
+        
+        CPU inference is bound by weight bandwidth, so dynamic int8
+        quantization roughly halves the bytes moved per chunk. The GPU
+        model is left in floating point.
+        
+        Args:
+            model: CPU KModel instance in eval mode
+            
+        Returns:
+            The quantized model, or the original one if quantization is
+            disabled or fails
+        """
+        if not INT8_CPU_ENABLED:
+            return model
+            
+        try:
+            engines = torch.backends.quantized.supported_engines
+            # fbgemm targets x86, qnnpack targets ARM
+            torch.backends.quantized.engine = (
+                'fbgemm' if 'fbgemm' in engines else 'qnnpack')
+            model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8)
+            logger.info("🗜️ CPU model quantized to int8")
+        except Exception as e:
+            logger.warning(
+                f"⚠️ int8 quantization failed, using FP32 CPU model: {e}")
+        return model
+        
+    def _compile_model(self, model, mode: str):
+        """
+        Compile the tensor forward pass of a Kokoro model with torch.compile.
+        
+        Only ``forward_with_tokens`` is compiled: ``KModel.forward`` does
+        Python string handling before dispatching to it, and it looks the
+        method up on the instance, so both entry points pick up the
+        compiled version. Compiled kernels are cached on disk so later
+        launches skip recompilation.
+        
+        The forward pass can't be captured as a whole with an explicit
+        ``torch.cuda.CUDAGraph``: the audio length follows the predicted
+        phoneme durations, so the alignment and decoder tensor shapes are
+        only known mid-forward. CUDA graphs are instead left to the GPU's
+        ``max-autotune`` mode, whose cudagraph trees record and replay per
+        observed input shape.
+        
+        Args:
+            model: Loaded KModel instance
+            mode: torch.compile mode for this device
+        """
+        if not COMPILE_ENABLED:
+            return
+            
+        try:
+            os.environ.setdefault(
+                "TORCHINDUCTOR_CACHE_DIR",
+                os.path.expanduser("~/.cache/peregrine/inductor"))
+            import torch._inductor.config as inductor_config
+            inductor_config.fx_graph_cache = True
+            
+            model.forward_with_tokens = torch.compile(
+                model.forward_with_tokens, mode=mode, dynamic=True)
+        except Exception as e:
+            logger.warning(
+                f"⚠️ torch.compile unavailable, running eagerly: {e}")
+            
+    def _warmup_models(self):
+        """
+        Run each model once so compilation happens off the hot path.
+        
+        The pass goes through _infer under the same inference mode and
+        autocast as real synthesis, so the compiled graphs' guards match
+        the first utterance and it doesn't recompile.
+        """
+        try:
+            voice_pack = self._get_voice_pack(self.current_voice.voice_code)
+            ref_s = voice_pack[len(WARMUP_PHONEMES) - 1]
+        except Exception as e:
+            logger.warning(f"⚠️ Model warm-up skipped: {e}")
+            return
+            
+        for name, model in list(self.models.items()):
+            try:
+                with torch.inference_mode():
+                    with self._model_lock, self._autocast(name == 'gpu'):
+                        self._infer(model, WARMUP_PHONEMES, ref_s, 1.0)
+            except Exception as e:
+                # Compilation failed (e.g. no C++ toolchain); go eager
+                logger.warning(
+                    f"⚠️ Compiled {name} model failed, using eager: {e}")
+                model.__dict__.pop('forward_with_tokens', None)
+                
+    def warmup(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the models have been warmed up.
+        
+        Initialization starts the warm-up in the background when models
+        are compiled; this waits for it. Otherwise one warm-up pass is run
+        now, so first-call costs are paid before the first utterance.
+        
+        Args:
+            timeout: Maximum seconds to wait; None waits indefinitely
+            
+        Returns:
+            bool: True if warm-up has finished
+        """
+        if not self.is_initialized:
+            return False
+            
+        if self._warmup_thread is None:
+            self._warmup_thread = threading.Thread(
+                target=self._warmup_models, daemon=True)
+            self._warmup_thread.start()
+        self._warmup_thread.join(timeout)
+        return not self._warmup_thread.is_alive()
+        
     def setup_kokoro_voices(self):
         """Set up available Kokoro voices."""
         try:
@@ -251,14 +657,16 @@ class KokoroEngine:
                 voices.append(voice)
                 
             self.available_voices = voices
+            self._voice_by_name = {v.name: v for v in voices}
+            self._voice_by_code = {v.voice_code: v for v in voices}
             if voices:
-                self.current_voice = voices[0]  # Default to first voice
+                self._bind_voice(voices[0])  # Default to first voice
                 
-            print(f"Set up {len(voices)} Kokoro voices")
+            logger.info(f"Set up {len(voices)} Kokoro voices")
             return True
             
         except Exception as e:
-            print(f"Error setting up Kokoro voices: {e}")
+            logger.error(f"Error setting up Kokoro voices: {e}")
             return False
             
     def start_worker_thread(self):
@@ -270,25 +678,49 @@ class KokoroEngine:
             self.worker_thread.start()
             
     def _worker_loop(self):
-        """Worker thread loop for processing TTS requests."""
-        while not self._stop_event.is_set():
+        """
+        Worker thread loop for processing TTS requests.
+        
+        Blocks on the request slot without a timeout, so the thread stays
+        parked while idle; cleanup() wakes it with a None sentinel.
+        """
+        # Grad mode is per thread; nothing here ever trains
+        torch.set_grad_enabled(False)
+        
+        while True:
+            task = self.speech_queue.get()
+            if task is None:  # Shutdown signal
+                self._stop_event.set()
+                break
+                
             try:
-                task = self.speech_queue.get(timeout=1.0)
-                if task is None:  # Shutdown signal
-                    break
-                    
                 if task['action'] == 'speak':
-                    self._synthesize_with_kokoro(task['text'], task['speed'])
+                    # Move straight on to the next sentence while this one
+                    # plays; a newer request or stop() abandons the rest
+                    generation = task['generation']
+                    for sentence in task['sentences']:
+                        if not self._is_current(generation):
+                            break
+                        self._synthesize_with_kokoro(
+                            sentence, task['speed'], generation)
+                        
+                    # Once nothing is left, let the audio finish before
+                    # reporting idle
+                    if self.speech_queue.empty():
+                        self._wait_for_playback(generation)
                 elif task['action'] == 'stop':
                     self.is_speaking = False
                     self.is_paused = False
                     
-            except queue.Empty:
-                continue
             except Exception as e:
-                print(f"TTS worker error: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"TTS worker error: {e}")
+                
+            # Go idle unless speak() queued something meanwhile; the lock
+            # keeps a new request from being marked done
+            with self._idle_lock:
+                if self.speech_queue.empty():
+                    self.is_speaking = False
+                    self._done.set()
                 
     def get_available_voices(self) -> List[Voice]:
         """Get list of available voices."""
@@ -296,12 +728,43 @@ class KokoroEngine:
         
     def set_voice(self, voice_name: str) -> bool:
         """Set the current voice by name."""
-        for voice in self.available_voices:
-            if voice.name == voice_name:
-                self.current_voice = voice
-                print(f"Voice changed to: {voice_name}")
-                return True
-        return False
+        voice = self._voice_by_name.get(voice_name)
+        if voice is None or not self._bind_voice(voice):
+            return False
+        logger.debug("Voice changed to: %s", voice_name)
+        return True
+        
+    def get_voice_by_code(self, voice_code: str) -> Optional[Voice]:
+        """Get a voice by its Kokoro voice code (e.g. "af_heart")."""
+        return self._voice_by_code.get(voice_code)
+        
+    def _bind_voice(self, voice: Voice) -> bool:
+        """
+        Make a voice current and resolve its pipeline.
+        
+        The voice and its pipeline are published as one tuple, so a
+        synthesis call running concurrently never pairs a new voice with
+        the old voice's pipeline. A voice pack that isn't cached yet is
+        loaded in the background.
+        
+        Args:
+            voice: Voice to select
+            
+        Returns:
+            bool: True if the voice's language has a pipeline
+        """
+        # First character of voice_code indicates language:
+        # 'a' = American English, 'b' = British English
+        pipeline = self.pipelines.get(voice.voice_code[0])
+        if pipeline is None:
+            logger.error(
+                f"❌ Pipeline not available for voice: {voice.voice_code}")
+            return False
+            
+        self._current_binding = (voice, pipeline)
+        self.current_voice = voice
+        self._prefetch_voice_pack(voice.voice_code)
+        return True
         
     def speak(self, text: str, speed: float = 1.0):
         """
@@ -309,7 +772,9 @@ class KokoroEngine:
         
         This is the main public interface for text-to-speech conversion.
         The method queues the request and returns immediately, with actual
-        synthesis happening in the background worker thread.
+        synthesis happening in the background worker thread. Long texts are
+        synthesized sentence by sentence so the first sentence can start playing
+        while the rest are still being synthesized.
         
         Args:
             text: Text to synthesize (supports any length)
@@ -318,27 +783,36 @@ class KokoroEngine:
         """
         # Validate engine state
         if not self.is_initialized:
-            print("❌ TTS engine not initialized")
+            logger.error("❌ TTS engine not initialized")
             return
             
         if not text.strip():
-            print("⚠️ Empty text provided")
+            logger.warning("⚠️ Empty text provided")
             return
             
         # Stop any current speech and clear queue
         self.stop()
         
         # Queue the new synthesis request
-        self.speech_queue.put({
-            'action': 'speak',
-            'text': text.strip(),
-            'speed': speed
-        })
-        
-        # Update state
-        self.is_speaking = True
-        self.is_paused = False
-        print(f"📝 Queued TTS for: '{text[:50]}...'")
+        text = text.strip()
+        if len(text) > SENTENCE_SPLIT_LENGTH:
+            sentences = [s for s in _SENT_RE.split(text) if s]
+        else:
+            sentences = [text]
+            
+        # Update state before queueing so the worker sees it as active
+        with self._idle_lock:
+            self._generation += 1
+            self._done.clear()
+            self.is_speaking = True
+            self.is_paused = False
+            self.speech_queue.put({
+                'action': 'speak',
+                'sentences': sentences,
+                'speed': speed,
+                'generation': self._generation
+            })
+        logger.debug("📝 Queued TTS for: '%s...'", text[:50])
         
     def pause(self):
         """
@@ -347,10 +821,14 @@ class KokoroEngine:
         Temporarily stops audio playback without losing position.
         Use resume() to continue from where it left off.
         """
+        # A repeat pause would move _paused_at and lose the paused time
+        if self.is_paused:
+            return
         if PYGAME_AVAILABLE and pygame.mixer.get_init():
-            pygame.mixer.music.pause()
+            pygame.mixer.pause()
+            self._paused_at = time.monotonic()
             self.is_paused = True
-            print("⏸️ TTS paused")
+            logger.debug("⏸️ TTS paused")
         
     def resume(self):
         """
@@ -360,9 +838,13 @@ class KokoroEngine:
         Only works if TTS was previously paused, not stopped.
         """
         if PYGAME_AVAILABLE and pygame.mixer.get_init():
-            pygame.mixer.music.unpause()
+            pygame.mixer.unpause()
+            if self.is_paused:
+                # Playback deadlines move back by the time spent paused
+                self._channel_end += time.monotonic() - self._paused_at
             self.is_paused = False
-            print("▶️ TTS resumed")
+            self._playback_wake.set()
+            logger.debug("▶️ TTS resumed")
         
     def stop(self):
         """
@@ -371,21 +853,35 @@ class KokoroEngine:
         This completely stops current synthesis and playback,
         clearing any pending requests in the queue.
         """
-        # Clear all queued requests
-        while not self.speech_queue.empty():
-            try:
-                self.speech_queue.get_nowait()
-            except queue.Empty:
-                break
-                
+        # Drop any pending request and abandon the one in progress
+        with self._idle_lock:
+            self._generation += 1
+            self.speech_queue.clear()
+        
         # Stop pygame audio playback
         if PYGAME_AVAILABLE and pygame.mixer.get_init():
-            pygame.mixer.music.stop()
+            pygame.mixer.stop()
             
-        # Reset state
+        # Reset state and wake anything waiting on playback
         self.is_speaking = False
         self.is_paused = False
-        print("⏹️ TTS stopped")
+        self._playback_wake.set()
+        logger.debug("⏹️ TTS stopped")
+        
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until queued speech has been synthesized and played out.
+        
+        Returns as soon as the worker goes idle, so callers don't have to
+        guess how long an utterance takes.
+        
+        Args:
+            timeout: Maximum seconds to wait; None waits indefinitely
+            
+        Returns:
+            bool: True if the engine is idle, False if the wait timed out
+        """
+        return self._done.wait(timeout)
         
     def is_speaking_now(self) -> bool:
         """
@@ -396,165 +892,746 @@ class KokoroEngine:
         """
         return self.is_speaking and not self.is_paused
         
-    def _synthesize_with_kokoro(self, text: str, speed: float):
+    def _is_current(self, generation: int) -> bool:
+        """
+        Check whether the request with this generation should continue.
+        
+        speak() and stop() bump the generation, so an older request sees
+        the change even though a newer speak() sets is_speaking again.
+        
+        Args:
+            generation: Generation the request was queued with
+            
+        Returns:
+            bool: True if the request is still the live one
+        """
+        return self.is_speaking and generation == self._generation
+        
+    @torch.inference_mode()
+    def _synthesize_with_kokoro(self, text: str, speed: float,
+                                generation: int):
         """
         Synthesize text using the Kokoro AI TTS system.
         
         This method performs the complete TTS pipeline:
         1. Validate voice selection and parameters
-        2. Select appropriate language pipeline (American/British)
-        3. Load the specific voice model
+        2. Use the language pipeline bound by set_voice (American/British)
+        3. Use the voice pack bound by set_voice (loaded if still pending)
         4. Choose AI model (GPU preferred, CPU fallback)
         5. Process text through phoneme generation
         6. Generate audio using neural synthesis
-        7. Play audio through pygame
+        7. Queue each chunk on the mixer channel as soon as it is ready
+        
+        Playback of chunk N overlaps with synthesis of chunk N+1; the
+        worker thread waits for the channel to drain afterwards.
         
         The synthesis process uses advanced AI models to generate
         natural-sounding speech with proper intonation, rhythm, and
-        emotional expression.
+        emotional expression. It runs under inference mode, so no autograd
+        bookkeeping happens on any forward pass.
         
         Args:
             text: Text to synthesize (any length supported)
             speed: Speech speed multiplier (0.5-2.0 recommended)
+            generation: Generation of the request; synthesis stops once a
+                newer speak() or stop() has superseded it
         """
         try:
-            # Validate current voice selection
-            if not self.current_voice or not self.current_voice.voice_code:
-                print("❌ No voice selected")
+            setup = self._synthesis_setup()
+            if setup is None:
                 return
-                
-            voice_code = self.current_voice.voice_code
-            voice_name = self.current_voice.name
+            voice_code, pipeline, voice_pack, model, use_gpu = setup
             
-            print(f"🗣️ Synthesizing with Kokoro: '{text[:50]}...' "
-                  f"using {voice_name} (speed: {speed}x)")
+            logger.debug("🗣️ Synthesizing with Kokoro: '%s...' "
+                         "using %s (speed: %sx)", text[:50],
+                         voice_code, speed)
             
-            # Get the appropriate pipeline for this voice
-            # First character of voice_code indicates language:
-            # 'a' = American English, 'b' = British English
-            lang_code = voice_code[0]
-            if lang_code not in self.pipelines:
-                print(f"❌ Pipeline not available for language: {lang_code}")
-                return
+            # Generate audio through the AI pipeline
+            chunk_count = 0
+            segments = pipeline(text, voice_code, speed)
+            for phonemes in self._batch_phonemes(segments):
+                if not self._is_current(generation):
+                    break  # Stopped or superseded while synthesizing
+                    
+                # Get reference audio embedding for this phoneme sequence
+                ref_s = voice_pack[len(phonemes)-1]
+                
+                # Generate audio chunk using neural synthesis
+                with self._model_lock, self._autocast(use_gpu):
+                    audio_chunk = self._infer(model, phonemes, ref_s, speed)
                 
-            pipeline = self.pipelines[lang_code]
+                # Convert to int16 on the model's device, then copy the
+                # PCM to the host and stream it to the mixer
+                pcm, ready = self._download_pcm16(audio_chunk)
+                self._play_audio(pcm, ready, generation)
+                chunk_count += 1
             
-            # Load the voice pack (neural voice embeddings)
-            voice_pack = pipeline.load_voice(voice_code)
-            if voice_pack is None or len(voice_pack) == 0:
-                print(f"❌ Failed to load voice: {voice_code}")
+            if not chunk_count:
+                logger.warning("❌ No audio generated")
                 return
+                
+            logger.debug("✅ Kokoro synthesis completed successfully")
+            
+        except Exception as e:
+            logger.exception(f"❌ Kokoro synthesis error: {e}")
             
-            # Choose AI model based on availability
-            # GPU provides faster synthesis, CPU is the fallback
-            use_gpu = self.cuda_available and 'gpu' in self.models
-            model = self.models['gpu' if use_gpu else 'cpu']
+    @torch.inference_mode()
+    def synthesize_batch(self, texts: List[str], speed: float = 1.0,
+                         voice_name: Optional[str] = None
+                         ) -> List[np.ndarray]:
+        """
+        Synthesize several texts with one voice, without playback.
+        
+        KModel runs one sequence per forward pass and its output length
+        depends on the predicted durations, so the texts can't share one
+        padded forward. Instead all of them are phonemized up front and
+        their forwards run back to back, taking the model lock per forward
+        so speak() can interleave its chunks; on the GPU the PCM copies
+        overlap the following forwards and the host synchronizes once at
+        the end.
+        
+        Unlike speak(), failures are raised rather than logged, so callers
+        such as the request pool can fail their requests: ValueError for an
+        unknown voice, RuntimeError if the engine can't synthesize.
+        
+        Args:
+            texts: Texts to synthesize
+            speed: Speech speed multiplier (0.5-2.0 recommended)
+            voice_name: Voice to use instead of the current one; the
+                current voice is left unchanged
             
-            print(f"🚀 Using {'GPU' if use_gpu else 'CPU'} model for synthesis")
+        Returns:
+            List[np.ndarray]: int16 PCM at sample_rate, one per text (empty
+            if a text produced no audio)
+        """
+        if not self.is_initialized:
+            raise RuntimeError("TTS engine not initialized")
             
-            # Generate audio through the AI pipeline
-            audio_chunks = []
-            for _, phonemes, _ in pipeline(text, voice_code, speed):
-                # Get reference audio embedding for this phoneme sequence
+        voice = None
+        if voice_name is not None:
+            voice = self._voice_by_name.get(voice_name)
+            if voice is None:
+                raise ValueError(f"Unknown voice: {voice_name}")
+                
+        setup = self._synthesis_setup(voice)
+        if setup is None:
+            raise RuntimeError("No usable voice for synthesis")
+        voice_code, pipeline, voice_pack, model, use_gpu = setup
+        
+        # Phonemization is CPU-only work; finish it before holding the lock
+        phoneme_chunks = [
+            list(self._batch_phonemes(pipeline(text, voice_code, speed)))
+            for text in texts
+        ]
+        
+        downloads = []
+        for chunks in phoneme_chunks:
+            parts = []
+            for phonemes in chunks:
                 ref_s = voice_pack[len(phonemes)-1]
+                with self._model_lock, self._autocast(use_gpu):
+                    audio = self._infer(model, phonemes, ref_s, speed)
+                parts.append(self._download_pcm16(audio))
+            downloads.append(parts)
+            
+        results = []
+        for parts in downloads:
+            for _, ready in parts:
+                if ready is not None:
+                    ready.synchronize()
+            results.append(np.concatenate([pcm for pcm, _ in parts])
+                           if parts else np.empty(0, dtype=np.int16))
+        return results
+        
+    def stream(self, text: str,
+               speed: float = 1.0) -> Iterator[Tuple[bytes, bool]]:
+        """
+        Synthesize text and yield its PCM progressively, without playback.
+        
+        Audio is cut into frames that start small and double in size, so
+        the first frame reaches the consumer after STREAM_FIRST_FRAME_MS of
+        audio rather than after a whole chunk or utterance. Synthesis of
+        the next chunk only happens when the consumer asks for more.
+        
+        Args:
+            text: Text to synthesize
+            speed: Speech speed multiplier (0.5-2.0 recommended)
+            
+        Yields:
+            tuple: (int16 PCM bytes at sample_rate, is_final); the final
+            frame may be short or empty
+        """
+        if not self.is_initialized:
+            logger.error("❌ TTS engine not initialized")
+            return
+            
+        setup = self._synthesis_setup()
+        if setup is None:
+            return
+        voice_code, pipeline, voice_pack, model, use_gpu = setup
+        
+        per_ms = self.sample_rate // 1000
+        frame = STREAM_FIRST_FRAME_MS * per_ms
+        max_frame = STREAM_MAX_FRAME_MS * per_ms
+        tail = STREAM_TAIL_MS * per_ms
+        
+        # Reuse phonemes from a preceding tokenize() of the same text
+        text = text.strip()
+        chunks = self._cached_phonemes(text, voice_code)
+        if chunks is None:
+            chunks = self._batch_phonemes(pipeline(text, voice_code, speed))
+            
+        pending = np.empty(0, dtype=np.int16)
+        for phonemes in chunks:
+            ref_s = voice_pack[len(phonemes)-1]
+            with torch.inference_mode():
+                with self._model_lock, self._autocast(use_gpu):
+                    audio_chunk = self._infer(model, phonemes, ref_s, speed)
+            pcm, ready = self._download_pcm16(audio_chunk)
+            if ready is not None:
+                ready.synchronize()
+            pending = np.concatenate((pending, pcm))
+            
+            # Keep the tail so there is always something left to flag final
+            while len(pending) >= frame + tail:
+                yield pending[:frame].tobytes(), False
+                pending = pending[frame:]
+                frame = min(frame * 2, max_frame)
                 
-                # Move tensors to appropriate device (GPU/CPU)
-                if use_gpu:
-                    phonemes = phonemes.cuda()
-                    ref_s = ref_s.cuda()
+        yield pending.tobytes(), True
+        
+    async def speak_async(self, text: str,
+                          speed: float = 1.0) -> AsyncIterator[bytes]:
+        """
+        Asynchronously stream synthesized PCM for text, without playback.
+        
+        Each frame of stream() is produced on the event loop's default
+        executor, so the loop stays responsive while the model runs. If
+        the consumer is cancelled while a frame is being produced, the
+        stream is closed on the executor once that frame finishes, since a
+        generator can't be closed while it is running.
+        
+        Args:
+            text: Text to synthesize
+            speed: Speech speed multiplier (0.5-2.0 recommended)
+            
+        Yields:
+            bytes: int16 PCM frames at sample_rate
+        """
+        loop = asyncio.get_running_loop()
+        frames = self.stream(text, speed)
+        running = threading.Lock()  # Held while a frame is being produced
+        
+        def step():
+            with running:
+                return next(frames, None)
                 
-                # Generate audio chunk using neural synthesis
-                audio_chunk = model(phonemes, ref_s, speed)
+        def close():
+            with running:
+                frames.close()
                 
-                # Convert back to CPU and numpy for audio playback
-                audio_chunk = audio_chunk.cpu().numpy()
-                audio_chunks.append(audio_chunk)
+        try:
+            while True:
+                frame = await loop.run_in_executor(None, step)
+                if frame is None:
+                    break
+                pcm, _ = frame
+                if pcm:
+                    yield pcm
+        finally:
+            if running.acquire(blocking=False):
+                try:
+                    frames.close()
+                finally:
+                    running.release()
+            else:
+                loop.run_in_executor(None, close)
+            
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Phonemize text with the current voice, ahead of synthesis.
+        
+        The result is remembered, so a following stream() or speak_async()
+        of the same text skips grapheme-to-phoneme conversion.
+        
+        Args:
+            text: Text to phonemize
+            
+        Returns:
+            List[str]: Phoneme strings, one per model call
+        """
+        binding = self._current_binding
+        if binding is None:
+            return []
+        voice, pipeline = binding
+            
+        text = text.strip()
+        chunks = self._cached_phonemes(text, voice.voice_code)
+        if chunks is None:
+            chunks = list(self._batch_phonemes(
+                pipeline(text, voice.voice_code)))
+            self._phoneme_cache = (text, voice.voice_code, chunks)
+        return chunks
+        
+    def _cached_phonemes(self, text: str,
+                         voice_code: str) -> Optional[List[str]]:
+        """Phoneme chunks from the last tokenize() if text and voice match."""
+        cached = self._phoneme_cache
+        if cached is not None and cached[:2] == (text, voice_code):
+            return cached[2]
+        return None
+        
+    def _synthesis_setup(self, voice: Optional[Voice] = None):
+        """
+        Resolve what a synthesis call needs for a voice.
+        
+        For the current voice, the voice and pipeline are read together
+        from the binding set_voice made. The voice pack is looked up by that
+        voice's code, so it always matches the voice, and a pack still
+        loading in the background is loaded here instead. Other voices are
+        resolved through the caches. The GPU model is preferred, with the
+        CPU model as the fallback.
+        
+        Args:
+            voice: Voice to resolve; None means the current voice
             
-            if not audio_chunks:
-                print("❌ No audio generated")
+        Returns:
+            tuple: (voice_code, pipeline, voice_pack, model, use_gpu), or
+            None if no usable voice is selected
+        """
+        if voice is not None and voice is not self.current_voice:
+            voice_code = voice.voice_code
+            pipeline = self.pipelines.get(voice_code[0])
+            if pipeline is None:
+                logger.error(
+                    f"❌ Pipeline not available for voice: {voice_code}")
+                return None
+        else:
+            # Validate current voice selection
+            binding = self._current_binding
+            if binding is None or not binding[0].voice_code:
+                logger.error("❌ No voice selected")
+                return None
+                
+            voice, pipeline = binding
+            voice_code = voice.voice_code
+        voice_pack = self._get_voice_pack(voice_code)
+        if voice_pack is None or len(voice_pack) == 0:
+            logger.error(f"❌ Failed to load voice: {voice_code}")
+            return None
+            
+        use_gpu = self.cuda_available and 'gpu' in self.models
+        model = self.models['gpu' if use_gpu else 'cpu']
+        logger.debug("🚀 Using %s model for synthesis",
+                     'GPU' if use_gpu else 'CPU')
+        return voice_code, pipeline, voice_pack, model, use_gpu
+        
+    def _get_voice_pack(self, voice_code: str) -> Optional[torch.Tensor]:
+        """
+        Get the voice pack for a voice, loading it on first use.
+        
+        Once the voice table is built, packs are rows of it, found through
+        the voice index. Before that, packs are cached per voice code and
+        stored on the GPU when one is available, so repeat utterances skip
+        both the load and the host-to-device copy.
+        
+        Args:
+            voice_code: Kokoro voice identifier (e.g. "af_heart")
+            
+        Returns:
+            Voice pack tensor, or None if the language has no pipeline
+        """
+        # The index is published after the table, so a row implies a table
+        row = self._voice_index.get(voice_code)
+        if row is not None:
+            return self._voice_table[row]
+            
+        voice_pack = self._voice_pack_cache.get(voice_code)
+        if voice_pack is not None:
+            return voice_pack
+            
+        pipeline = self.pipelines.get(voice_code[0])
+        if pipeline is None:
+            return None
+            
+        with self._voice_load_lock:
+            row = self._voice_index.get(voice_code)
+            if row is not None:
+                return self._voice_table[row]
+            with _mmap_loads():
+                voice_pack = pipeline.load_voice(voice_code)
+            if self.cuda_available:
+                voice_pack = voice_pack.cuda()
+            self._voice_pack_cache[voice_code] = voice_pack
+        return voice_pack
+        
+    def _build_voice_table(self):
+        """
+        Load every voice pack and stack them into one contiguous tensor.
+        
+        Runs in the background after start-up. Afterwards _get_voice_pack
+        returns rows of the table through the voice index, so switching
+        voices never touches disk and all packs share a single device
+        allocation. The per-voice cache and the pipelines' own copies of
+        the packs are then released, so no second set is kept. Loads hold
+        the voice load lock, so a background prefetch can't refill a
+        pipeline after it has been cleared.
+        """
+        codes = [v.voice_code for v in self.available_voices]
+        with self._voice_load_lock:
+            try:
+                with _mmap_loads():
+                    packs = [self.pipelines[code[0]].load_voice(code).cpu()
+                             for code in codes]
+                table = torch.stack(packs)
+                if self.cuda_available:
+                    table = table.cuda()
+            except Exception as e:
+                logger.warning(f"⚠️ Voice table not built: {e}")
                 return
                 
-            # Combine all audio chunks into final audio
-            full_audio = np.concatenate(audio_chunks, axis=0)
+            self._voice_table = table
+            self._voice_index = {code: i for i, code in enumerate(codes)}
+            self._voice_pack_cache = {}
+            for pipeline in self.pipelines.values():
+                pipeline.voices.clear()
+        logger.debug("Stacked %d voice packs: %s",
+                     len(codes), tuple(table.shape))
+        
+    def _prefetch_voice_pack(self, voice_code: str):
+        """Load a voice pack in the background if it isn't cached yet."""
+        if (voice_code in self._voice_index
+                or voice_code in self._voice_pack_cache):
+            return
             
-            # Play the synthesized audio
-            self._play_audio(full_audio)
+        def load():
+            try:
+                self._get_voice_pack(voice_code)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to preload voice {voice_code}: {e}")
+                
+        threading.Thread(target=load, daemon=True).start()
+        
+    def _infer(self, model, phonemes: str, ref_s: torch.Tensor,
+               speed: float) -> torch.Tensor:
+        """
+        Run one forward pass and keep the audio on the model's device.
+        
+        Mirrors KModel.forward, minus its trailing ``.cpu()``, so the PCM
+        conversion can happen before the device-to-host copy. On the GPU the
+        input ids are uploaded on a dedicated copy stream, which the compute
+        stream waits on, from a pinned staging buffer reused across calls.
+        Callers hold _model_lock, so only one upload uses the buffer at once.
+        
+        Args:
+            model: KModel to run
+            phonemes: Phoneme string for this chunk
+            ref_s: Reference style embedding for the chunk length
+            speed: Speech speed multiplier
             
-            print("✅ Kokoro synthesis completed successfully")
+        Returns:
+            torch.Tensor: Float audio samples on the model's device
+        """
+        device = model.device
+        input_ids = [0, *(i for i in map(model.vocab.get, phonemes)
+                          if i is not None), 0]
+        
+        if device.type == 'cuda' and self._copy_stream is not None:
+            host = self._stage_input_ids(input_ids)
+            with torch.cuda.stream(self._copy_stream):
+                input_ids = host.to(device, non_blocking=True)
+                self._ids_uploaded.record(self._copy_stream)
+            compute = torch.cuda.current_stream()
+            compute.wait_stream(self._copy_stream)
+            # The ids were allocated on the copy stream; keep the allocator
+            # from reusing them there while this forward still reads them
+            input_ids.record_stream(compute)
+        else:
+            input_ids = torch.tensor([input_ids], dtype=torch.long,
+                                     device=device)
             
-        except Exception as e:
-            print(f"❌ Kokoro synthesis error: {e}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            # Always reset speaking state
-            self.is_speaking = False
+        audio, _ = model.forward_with_tokens(
+            input_ids, ref_s.to(model.device), speed)
+        return audio.squeeze()
+        
+    def _stage_input_ids(self, input_ids: List[int]) -> torch.Tensor:
+        """
+        Write token ids into the pinned staging buffer for upload.
+        
+        The buffer grows by doubling and is otherwise reused. Before it is
+        overwritten, the previous upload out of it must have finished.
+        
+        Args:
+            input_ids: Token ids, including the boundary tokens
+            
+        Returns:
+            torch.Tensor: (1, len(input_ids)) pinned view of the buffer
+        """
+        n = len(input_ids)
+        self._ids_uploaded.synchronize()
+        staging = self._ids_staging
+        if staging is None or staging.numel() < n:
+            size = 512 if staging is None else staging.numel()
+            while size < n:
+                size *= 2
+            staging = torch.empty(size, dtype=torch.long, pin_memory=True)
+            self._ids_staging = staging
+        staging.numpy()[:n] = input_ids
+        return staging[:n].view(1, n)
+        
+    def _download_pcm16(self, audio: torch.Tensor):
+        """
+        Convert device audio to int16 PCM and start copying it to the host.
+        
+        Clipping and scaling run on the tensor's device, so on the GPU the
+        copy over PCIe moves 2 bytes per sample instead of 4. The copy goes
+        into pinned memory asynchronously; the returned event marks when
+        the host buffer is ready.
+        
+        Args:
+            audio: Float audio samples (any device)
+            
+        Returns:
+            tuple: (int16 numpy samples, CUDA event or None)
+        """
+        pcm = (audio.float().clamp(-1.0, 1.0) * 32767).to(torch.int16)
+        if not pcm.is_cuda:
+            return pcm.numpy(), None
+            
+        host = torch.empty(pcm.shape, dtype=torch.int16, pin_memory=True)
+        host.copy_(pcm, non_blocking=True)
+        ready = torch.cuda.Event()
+        ready.record()
+        return host.numpy(), ready
+        
+    def _batch_phonemes(self, segments):
+        """
+        Merge consecutive short pipeline segments into larger model calls.
+        
+        KModel only synthesizes one sequence per forward pass, so padded
+        batching isn't possible; instead, adjacent segments (e.g. short
+        lines) are joined until BATCH_PHONEMES is reached. This amortizes
+        per-call launch overhead while long segments pass through as-is.
+        
+        Args:
+            segments: Results yielded by a KPipeline call
+            
+        Yields:
+            str: Phoneme string for one model call
+        """
+        pending = ""
+        for _, phonemes, _ in segments:
+            if not phonemes:
+                continue
+            if pending and len(pending) + 1 + len(phonemes) > BATCH_PHONEMES:
+                yield pending
+                pending = phonemes
+            else:
+                pending = f"{pending} {phonemes}" if pending else phonemes
+                
+        if pending:
+            yield pending
             
-    def _play_audio(self, audio_data: np.ndarray):
+    def _autocast(self, use_gpu: bool):
         """
-        Play audio using pygame.
+        Get the autocast context for a model forward pass.
+        
+        GPU inference runs in BF16, or FP16 on GPUs without BF16, so matmuls
+        and convolutions can use Tensor Cores; BF16 keeps FP32's exponent
+        range, so activations can't overflow the way they can in FP16. CPU
+        inference uses BF16 only where the hardware supports it natively.
+        
+        Args:
+            use_gpu: Whether the forward pass runs on the GPU model
+        """
+        if use_gpu:
+            return torch.autocast(device_type='cuda',
+                                  dtype=self._gpu_autocast_dtype,
+                                  enabled=FP16_ENABLED)
+        return torch.autocast(device_type='cpu', dtype=torch.bfloat16,
+                              enabled=self._cpu_autocast)
+        
+    def _play_audio(self, audio_data: np.ndarray, ready=None,
+                    generation: Optional[int] = None):
+        """
+        Queue an audio chunk for playback on the engine's mixer channel.
+        
+        The samples are handed to the mixer straight from memory, so no
+        temporary WAV file is written or decoded per utterance. The first
+        chunk starts playing immediately; later chunks are queued behind it
+        so playback stays gapless while synthesis continues.
         
         Args:
             audio_data: Audio data as numpy array
+            ready: Optional CUDA event to wait on before reading the data
+            generation: Request generation; the chunk is dropped once a
+                newer speak() or stop() has superseded it
         """
         try:
-            if not PYGAME_AVAILABLE:
-                print("pygame not available for audio playback")
+            if not PYGAME_AVAILABLE or self._channel is None:
+                logger.warning("No audio device available for playback")
                 return
                 
+            # Wait for an in-flight device-to-host copy to land
+            if ready is not None:
+                ready.synchronize()
+                
             # Ensure audio is in the right format
             if audio_data.dtype != np.int16:
-                # Convert from float to int16
-                audio_data = (audio_data * 32767).astype(np.int16)
-            
-            # Create a temporary file for pygame
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                if SCIPY_AVAILABLE:
-                    import scipy.io.wavfile as wav
-                    wav.write(tmp_file.name, self.sample_rate, audio_data)
-                else:
-                    # Fallback: write raw audio (less compatible)
-                    with open(tmp_file.name, 'wb') as f:
-                        f.write(audio_data.tobytes())
-                
-                # Load and play with pygame
-                pygame.mixer.music.load(tmp_file.name)
-                pygame.mixer.music.play()
-                
-                # Wait for playback to complete
-                while pygame.mixer.music.get_busy() and self.is_speaking:
-                    pygame.time.wait(100)
-                    
-                # Clean up temporary file
-                os.unlink(tmp_file.name)
+                audio_data = np.rint(np.clip(audio_data, -1.0, 1.0) * 32767
+                                     ).astype(np.int16)
+            audio_data = np.ascontiguousarray(audio_data)
+            
+            # Build the sound directly from the sample buffer
+            try:
+                sound = pygame.sndarray.make_sound(audio_data)
+            except (ImportError, NotImplementedError):
+                # sndarray needs pygame built with numpy support
+                sound = pygame.mixer.Sound(buffer=audio_data.tobytes())
+                
+            channel = self._channel
+            length = sound.get_length()
+            
+            # A channel holds one queued sound; wait for the slot to free up,
+            # which happens when the currently playing sound ends
+            if generation is None:
+                generation = self._generation
+            self._wait_on_channel(
+                lambda: channel.get_queue() is None,
+                lambda: self._channel_end - self._queued_length,
+                generation)
+                
+            if not self._is_current(generation):
+                return
+            if channel.get_busy():
+                channel.queue(sound)
+                self._channel_end += length
+                self._queued_length = length
+            else:
+                channel.play(sound)
+                self._channel_end = time.monotonic() + length
+                self._queued_length = 0.0
                 
         except Exception as e:
-            print(f"Audio playback error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Audio playback error: {e}")
+            
+    def _wait_for_playback(self, generation: int):
+        """Block until queued audio has played or the request is stopped."""
+        if not PYGAME_AVAILABLE or self._channel is None:
+            return
             
+        channel = self._channel
+        self._wait_on_channel(
+            lambda: channel.get_queue() is None and not channel.get_busy(),
+            lambda: self._channel_end, generation)
+            
+    def _wait_on_channel(self, done, deadline, generation: int):
+        """
+        Sleep until a channel condition holds or speech is stopped.
+        
+        Rather than polling the mixer, the thread sleeps until the time the
+        condition is expected to become true (known from the queued sound
+        lengths) and is woken early by stop() or resume(). Past that time,
+        the mixer's latency is covered by waits that double from 10 ms up
+        to 160 ms rather than a fixed-rate poll. While paused it sleeps
+        until woken.
+        
+        Args:
+            done: Callable returning True once the wait is over
+            deadline: Callable returning the expected monotonic end time
+            generation: Request generation; the wait ends once it is
+                superseded
+        """
+        overdue = 0.01
+        while True:
+            self._playback_wake.clear()
+            if done() or not self._is_current(generation):
+                return
+            if self.is_paused:
+                self._playback_wake.wait()
+                continue
+                
+            remaining = deadline() - time.monotonic()
+            if remaining > 0:
+                self._playback_wake.wait(remaining)
+                overdue = 0.01
+            else:
+                self._playback_wake.wait(overdue)
+                overdue = min(overdue * 2, 0.16)
+                
     def cleanup(self):
-        """Clean up resources."""
+        """
+        Clean up resources.
+        
+        Only the first call does anything. Once the singleton is cleared a
+        new engine may own the mixer, so a repeat call (e.g. from __del__)
+        must not stop or quit it.
+        """
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
         try:
+            # Stop audio so the worker isn't left waiting on playback
+            self.stop()
+            
             # Stop worker thread
-            self._stop_event.set()
             self.speech_queue.put(None)  # Signal shutdown
             
             if self.worker_thread and self.worker_thread.is_alive():
                 self.worker_thread.join(timeout=2.0)
+            self._done.set()
             
-            # Stop audio
-            self.stop()
-            
+            # Close the shared request pool bound to this engine, if any
+            request_pool = sys.modules.get(f"{__package__}.request_pool")
+            if request_pool is not None:
+                request_pool.reset_request_pool(self)
+                
             # Cleanup pygame
             if PYGAME_AVAILABLE:
                 pygame.mixer.quit()
                 
-            print("Kokoro TTS Engine cleaned up")
+            # Let the next instance() call build a fresh engine
+            with KokoroEngine._instance_lock:
+                if KokoroEngine._instance is self:
+                    KokoroEngine._instance = None
+                    
+            self._release_memory()
+            logger.info("Kokoro TTS Engine cleaned up")
             
         except Exception as e:
-            print(f"Cleanup error: {e}")
+            logger.error(f"Cleanup error: {e}")
             
+    def _release_memory(self):
+        """
+        Drop model and voice references and hand freed memory back.
+        
+        Collecting reference cycles first lets the CUDA caching allocator
+        return its now-unused blocks to the driver, so back-to-back engines
+        in one process don't accumulate device memory. On Linux the C heap
+        is also trimmed so freed host pages go back to the OS.
+        """
+        self.is_initialized = False
+        self.models = {}
+        self.pipelines = {}
+        self._current_binding = None
+        self._voice_pack_cache = {}
+        self._voice_index = {}  # Before the table; see _get_voice_pack
+        self._voice_table = None
+        self._phoneme_cache = None
+        self.current_audio = None
+        
+        gc.collect()
+        if self.cuda_available and torch.cuda.is_available():
+            torch.cuda.synchronize()
+            torch.cuda.empty_cache()
+            torch.cuda.ipc_collect()
+        if sys.platform.startswith("linux"):
+            try:
+                ctypes.CDLL("libc.so.6").malloc_trim(0)
+            except (OSError, AttributeError):
+                pass  # Not glibc
+                
     def __del__(self):
-        """Destructor."""
-        self.cleanup()
+        """Destructor; does nothing after an explicit cleanup()."""
+        if not getattr(self, '_cleaned_up', True):
+            self.cleanup()
@@ -0,0 +1,158 @@
+"""
+Process-wide request pool for Kokoro synthesis.
+
+Concurrent callers (threads, asyncio tasks, a server's handlers) hand their
+texts to one pool instead of each driving the engine, so the model is
+loaded once and requests that arrive together are synthesized together.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from .kokoro_engine import KokoroEngine
+
+logger = logging.getLogger(__name__)
+
+
+class _PoolRequest:
+    """A queued synthesis request and the future that receives its PCM."""
+    
+    __slots__ = ('text', 'voice_name', 'speed', 'future')
+    
+    def __init__(self, text: str, voice_name: Optional[str], speed: float,
+                 future: Future):
+        self.text = text
+        self.voice_name = voice_name
+        self.speed = speed
+        self.future = future
+
+
+class KokoroRequestPool:
+    """
+    Pool that batches concurrent synthesis requests onto one engine.
+    
+    A background thread loops forever: each iteration drains whatever has
+    arrived (up to max_batch requests), groups it by voice and speed, and
+    runs each group through KokoroEngine.synthesize_batch. The batch size
+    therefore follows the pool depth; a lone request is served as soon as
+    it arrives, a burst is served in one pass.
+    
+    KModel doesn't expose its encoder, decoder and vocoder as separately
+    schedulable stages, so grouping happens per whole forward pass.
+    """
+    
+    def __init__(self, engine: Optional[KokoroEngine] = None,
+                 max_batch: int = 16):
+        """
+        Create the pool and start its worker thread.
+        
+        Args:
+            engine: Engine to synthesize with; defaults to the shared one
+            max_batch: Most requests taken from the pool per iteration
+        """
+        self.engine = engine or KokoroEngine.instance()
+        self.max_batch = max_batch
+        self._pending: List[_PoolRequest] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        
+    def add(self, text: str, voice_name: Optional[str] = None,
+            future: Optional[Future] = None, speed: float = 1.0) -> Future:
+        """
+        Queue text for synthesis.
+        
+        Args:
+            text: Text to synthesize
+            voice_name: Voice display name; None uses the current voice
+            future: Future to complete; a new one is created if omitted
+            speed: Speech speed multiplier (0.5-2.0 recommended)
+            
+        Returns:
+            Future: Resolves to int16 PCM at the engine's sample rate, or
+            raises what synthesize_batch raised (e.g. ValueError for an
+            unknown voice)
+        """
+        future = future or Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Request pool is closed")
+            self._pending.append(_PoolRequest(text, voice_name, speed, future))
+            self._cond.notify()
+        return future
+        
+    def close(self):
+        """Stop accepting requests and finish the ones already queued."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        
+    def _run(self):
+        """Worker loop: drain the pool and synthesize it group by group."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return  # Closed and drained
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                
+            groups: Dict[Tuple[Optional[str], float],
+                         List[_PoolRequest]] = {}
+            for request in batch:
+                key = (request.voice_name, request.speed)
+                groups.setdefault(key, []).append(request)
+                
+            for (voice_name, speed), requests in groups.items():
+                # Skip requests whose callers cancelled them meanwhile
+                live = [r for r in requests
+                        if r.future.set_running_or_notify_cancel()]
+                if not live:
+                    continue
+                try:
+                    outputs = self.engine.synthesize_batch(
+                        [r.text for r in live], speed, voice_name=voice_name)
+                except Exception as e:
+                    logger.exception(f"Pooled synthesis failed: {e}")
+                    for request in live:
+                        request.future.set_exception(e)
+                    continue
+                for request, pcm in zip(live, outputs):
+                    request.future.set_result(pcm)
+
+
+_shared_pool: Optional[KokoroRequestPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_request_pool() -> KokoroRequestPool:
+    """Return the process-wide request pool, creating it on first use."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = KokoroRequestPool()
+        return _shared_pool
+
+
+def reset_request_pool(engine: Optional[KokoroEngine] = None):
+    """
+    Close the process-wide pool so the next get_request_pool() makes one.
+    
+    KokoroEngine.cleanup() calls this, so the shared pool never outlives
+    the engine it synthesizes with.
+    
+    Args:
+        engine: Only reset the pool if it is bound to this engine
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        pool = _shared_pool
+        if pool is None or (engine is not None and pool.engine is not engine):
+            return
+        _shared_pool = None
+    pool.close()
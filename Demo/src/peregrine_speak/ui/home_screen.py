@@ -2,118 +2,347 @@
 Home Screen for Peregrine Speak application.
 """
 
-from PyQt6.QtWidgets import (QWidget, QPushButton,
-                             QLabel, QGraphicsOpacityEffect)
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal
-from PyQt6.QtGui import (QFont, QPalette, QLinearGradient, QBrush, QColor, 
-                         QPainter, QPainterPath, QPixmap)
+from PyQt6.QtWidgets import (QWidget, QPushButton, QLabel,
+                             QGraphicsOpacityEffect, QHBoxLayout, QSizePolicy,
+                             QStackedLayout, QVBoxLayout)
+from PyQt6.QtCore import (Qt, QObject, QTimer, QPropertyAnimation,
+                          QEasingCurve, QPointF, QRectF, QSize,
+                          pyqtSignal)
+from PyQt6.QtGui import (QFont, QPalette, QGradient, QLinearGradient, QBrush,
+                         QColor, QPen, QPainter, QPixmap, QPixmapCache,
+                         QPolygonF, QTextLayout)
+import logging
+import math
 import time
 import os
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Stylesheets
+_WELCOME_QSS = """
+    color: white;
+    font-size: 28px;
+    font-weight: bold;
+    text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.7);
+    background: rgba(0, 0, 0, 0.3);
+    border-radius: 10px;
+    padding: 10px;
+"""
+
+_START_BUTTON_QSS = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.95);
+        border: 2px solid rgba(100, 100, 100, 0.8);
+        border-radius: 30px;
+        font-size: 20px;
+        font-weight: bold;
+        color: #333;
+        padding: 15px 30px;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 1.0);
+        border: 2px solid rgba(80, 80, 80, 1.0);
+        transform: scale(1.05);
+    }
+    QPushButton:pressed {
+        background: rgba(240, 240, 240, 1.0);
+    }
+"""
+
+_HOME_SCREEN_QSS = """
+    HomeScreen {
+        background: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 1,
+            stop: 0 #a8e6cf,
+            stop: 0.5 #7fcdcd,
+            stop: 1 #6a5acd
+        );
+    }
+"""
+
+_TYPEWRITER_QSS = "color: white; font-size: 24px; font-weight: bold;"
+
+_LOGO_FALLBACK_QSS = "font-size: 200px; color: rgba(255, 255, 255, 0.8);"
+
+# Logo layer margins (left, top, right, bottom), leaving room for the
+# welcome text and the start button
+LOGO_MARGINS = (50, 80, 50, 70)
+
+# Budget for QPixmapCache, which holds the smoothly scaled logo variants
+PIXMAP_CACHE_LIMIT_KB = 20 * 1024
+
+
+def _logo_cache_key(size):
+    """QPixmapCache key for the logo scaled to a (width, height) target."""
+    return f"peregrine_logo@{size[0]}x{size[1]}"
+
+
+class AnimationClock(QObject):
+    """
+    Shared frame clock for UI animations.
+    
+    One QTimer drives every subscriber through the tick signal, so
+    concurrent animations share one wakeup rather than one private timer
+    each. It ticks at the shortest interval any subscriber asked for, so
+    a lone slow animation doesn't wake the event loop every frame, and
+    it only runs while something is subscribed.
+    """
+    
+    tick = pyqtSignal()
+    
+    _instance = None
+    
+    def __init__(self):
+        super().__init__()
+        self._intervals = []  # (slot, interval_ms) per subscriber
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.tick)
+        
+    @classmethod
+    def instance(cls):
+        """Return the process-wide clock, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+        
+    def subscribe(self, slot, interval_ms: int):
+        """
+        Connect slot to tick and make sure it ticks at least this often.
+        
+        Args:
+            slot: Callable invoked on every tick
+            interval_ms: Longest gap between ticks the slot can accept
+        """
+        self.tick.connect(slot)
+        self._intervals.append((slot, interval_ms))
+        self._retime()
+        
+    def unsubscribe(self, slot):
+        """Disconnect slot from tick, stopping the timer after the last."""
+        self.tick.disconnect(slot)
+        self._intervals = [(s, ms) for s, ms in self._intervals if s != slot]
+        self._retime()
+        
+    def _retime(self):
+        """Tick at the shortest subscribed interval, or stop if none."""
+        if not self._intervals:
+            self._timer.stop()
+            return
+        interval = min(ms for _, ms in self._intervals)
+        if interval != self._timer.interval():
+            self._timer.setInterval(interval)
+        if not self._timer.isActive():
+            self._timer.start()
+
 
 class TypewriterLabel(QLabel):
-    """A label that displays text with a typewriter animation effect."""
+    """
+    A label that displays text with a typewriter animation effect.
+    
+    The full text is shaped once with a QTextLayout and painted clipped to
+    the revealed prefix, so each tick only repaints the new glyph's rect
+    instead of re-laying out the whole label through setText.
+    """
     
     finished = pyqtSignal()
     
     def __init__(self, full_text: str, parent=None):
         super().__init__(parent)
         self.full_text = full_text
-        self.current_text = ""
         self.current_index = 0
         
         # Set up the label
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setStyleSheet("color: white; font-size: 24px; font-weight: bold;")
-        
-        # Timer for typewriter effect
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.add_next_character)
+        self.setStyleSheet(_TYPEWRITER_QSS)
+        
+        # Shaped text, rebuilt when the (stylesheet) font changes
+        self._layout = None
+        self._layout_font = None
+        
+        # Typewriter pacing, driven by the shared AnimationClock
+        self._delay_ns = 0
+        self._last_advance = 0
+        self._ticking = False
+        
+    def _text_layout(self):
+        """Return the shaped full text, laying it out again on font change."""
+        font = self.font()
+        if self._layout is None or font != self._layout_font:
+            layout = QTextLayout(self.full_text, font)
+            layout.setCacheEnabled(True)
+            layout.beginLayout()
+            line = layout.createLine()
+            line.setLineWidth(1e6)
+            layout.endLayout()
+            self._layout = layout
+            self._layout_font = QFont(font)
+        return self._layout
+        
+    def _text_origin(self):
+        """Top-left of the text, centred in the contents rect."""
+        line = self._text_layout().lineAt(0)
+        rect = self.contentsRect()
+        x = rect.x() + (rect.width() - line.naturalTextWidth()) / 2
+        y = rect.y() + (rect.height() - line.height()) / 2
+        return QPointF(x, y)
+        
+    def sizeHint(self):
+        """Size of the full text plus margins, independent of progress."""
+        line = self._text_layout().lineAt(0)
+        margins = self.contentsMargins()
+        return QSize(
+            math.ceil(line.naturalTextWidth()) +
+            margins.left() + margins.right(),
+            math.ceil(line.height()) + margins.top() + margins.bottom()
+        )
         
     def start_animation(self, delay_ms: int = 100):
         """Start the typewriter animation."""
-        self.current_text = ""
         self.current_index = 0
-        self.setText("")
-        self.timer.start(delay_ms)
+        self.update()
+        self._delay_ns = delay_ms * 1_000_000
+        self._last_advance = time.monotonic_ns()
+        # Re-subscribe so the clock picks up a changed delay
+        self._stop_ticking()
+        AnimationClock.instance().subscribe(self._on_tick, delay_ms)
+        self._ticking = True
+            
+    def _stop_ticking(self):
+        """Stop receiving clock ticks."""
+        if self._ticking:
+            AnimationClock.instance().unsubscribe(self._on_tick)
+            self._ticking = False
+            
+    def _on_tick(self):
+        """Advance one character once the per-character delay has passed."""
+        now = time.monotonic_ns()
+        # A tenth of slack, as the coarse timer may fire slightly early
+        if now - self._last_advance < self._delay_ns * 9 // 10:
+            return
+        self._last_advance = now
+        self.add_next_character()
         
     def add_next_character(self):
-        """Add the next character to the display."""
-        if self.current_index < len(self.full_text):
-            self.current_text += self.full_text[self.current_index]
-            self.setText(self.current_text)
-            self.current_index += 1
+        """Reveal the next character, repainting only its glyph."""
+        i = self.current_index
+        if i < len(self.full_text):
+            self.current_index = i + 1
+            line = self._text_layout().lineAt(0)
+            left = line.cursorToX(i)[0]
+            right = line.cursorToX(i + 1)[0]
+            
+            origin = self._text_origin()
+            glyph_rect = QRectF(origin.x() + left, origin.y(),
+                                right - left, line.height())
+            # Pad for antialiasing overhang past the advance width
+            self.update(glyph_rect.toAlignedRect().adjusted(-2, 0, 2, 0))
         else:
-            self.timer.stop()
+            self._stop_ticking()
             self.finished.emit()
+            
+    def paintEvent(self, event):
+        """Paint the background, then the revealed prefix of the text."""
+        # Background, border and padding come from the stylesheet
+        super().paintEvent(event)
+        if self.current_index == 0:
+            return
+            
+        line = self._text_layout().lineAt(0)
+        origin = self._text_origin()
+        revealed = line.cursorToX(self.current_index)[0]
+        
+        painter = QPainter(self)
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        painter.setClipRect(QRectF(origin.x(), origin.y(),
+                                   revealed, line.height()))
+        self._layout.draw(painter, origin)
+        painter.end()
 
 
 class PeregrineLogo(QWidget):
     """Custom widget that draws the Peregrine logo shape."""
     
+    # Logo polygons as pixel offsets from the widget centre (simplified
+    # angular peregrine falcon silhouette), built once and translated
+    _HEAD = QPolygonF([QPointF(x, y) for x, y in
+                       ((0, -80), (-30, -40), (10, -40))])
+    _BODY = QPolygonF([QPointF(x, y) for x, y in
+                       ((-30, -40), (-60, 0), (-30, 60), (40, 40),
+                        (60, -20), (10, -40))])
+    _WING = QPolygonF([QPointF(x, y) for x, y in
+                       ((-20, -20), (20, -10), (30, 20), (-10, 30))])
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(200, 200)
         self.setMaximumSize(300, 300)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
         
-    def paintEvent(self, event):
-        """Paint the Peregrine logo shape."""
-        painter = QPainter(self)
+        # Paint resources are size-independent, so they are built once: the
+        # gradient is relative to the paint device (the widget-sized cache)
+        gradient = QLinearGradient(0, 0, 1, 1)
+        gradient.setCoordinateMode(
+            QGradient.CoordinateMode.StretchToDeviceMode
+        )
+        gradient.setColorAt(0, QColor(60, 60, 120, 200))  # Dark blue
+        gradient.setColorAt(0.5, QColor(80, 80, 140, 180))  # Medium blue
+        gradient.setColorAt(1, QColor(100, 100, 160, 160))  # Light blue
+        self._body_brush = QBrush(gradient)
+        self._wing_brush = QBrush(QColor(120, 120, 180, 100))
+        self._pen = QPen(QColor(40, 40, 80, 220))
+        
+        # Logo rasterized at the current size; rebuilt on resize
+        self._cache = QPixmap()
+        
+    def resizeEvent(self, event):
+        """Re-rasterize the logo for the new widget size."""
+        super().resizeEvent(event)
+        self._rebuild_cache()
+        
+    def _rebuild_cache(self):
+        """Render the logo shape once into the cached pixmap."""
+        ratio = self.devicePixelRatioF()
+        self._cache = QPixmap(self.size() * ratio)
+        self._cache.setDevicePixelRatio(ratio)
+        self._cache.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(self._cache)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Get widget dimensions
         width = self.width()
         height = self.height()
         
-        # Create the logo path (simplified Peregrine shape)
-        path = QPainterPath()
-        
-        # Main body (angular bird-like shape)
-        # Start from top-left, create angular peregrine falcon silhouette
-        center_x = width // 2
-        center_y = height // 2
-        
-        # Head/beak (top triangle)
-        path.moveTo(center_x, center_y - 80)
-        path.lineTo(center_x - 30, center_y - 40)
-        path.lineTo(center_x + 10, center_y - 40)
-        path.lineTo(center_x, center_y - 80)
-        
-        # Body (diamond-like shape)
-        path.moveTo(center_x - 30, center_y - 40)
-        path.lineTo(center_x - 60, center_y)
-        path.lineTo(center_x - 30, center_y + 60)
-        path.lineTo(center_x + 40, center_y + 40)
-        path.lineTo(center_x + 60, center_y - 20)
-        path.lineTo(center_x + 10, center_y - 40)
-        path.lineTo(center_x - 30, center_y - 40)
-        
-        # Wing detail (additional angular element)
-        wing_path = QPainterPath()
-        wing_path.moveTo(center_x - 20, center_y - 20)
-        wing_path.lineTo(center_x + 20, center_y - 10)
-        wing_path.lineTo(center_x + 30, center_y + 20)
-        wing_path.lineTo(center_x - 10, center_y + 30)
-        wing_path.lineTo(center_x - 20, center_y - 20)
+        # Place the logo polygons around the widget centre
+        center = QPointF(width // 2, height // 2)
+        head = self._HEAD.translated(center)
+        body = self._BODY.translated(center)
+        wing = self._WING.translated(center)
         
         # Set gradient fill
-        gradient = QLinearGradient(0, 0, width, height)
-        gradient.setColorAt(0, QColor(60, 60, 120, 200))  # Dark blue
-        gradient.setColorAt(0.5, QColor(80, 80, 140, 180))  # Medium blue
-        gradient.setColorAt(1, QColor(100, 100, 160, 160))  # Light blue
-        
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(QColor(40, 40, 80, 220))
+        painter.setBrush(self._body_brush)
+        painter.setPen(self._pen)
         
         # Draw main shape
-        painter.drawPath(path)
+        painter.drawPolygon(head)
+        painter.drawPolygon(body)
         
         # Draw wing detail with different opacity
-        painter.setBrush(QBrush(QColor(120, 120, 180, 100)))
-        painter.drawPath(wing_path)
+        painter.setBrush(self._wing_brush)
+        painter.drawPolygon(wing)
         
         painter.end()
+        
+    def paintEvent(self, event):
+        """Paint the Peregrine logo shape from the cached pixmap."""
+        if self._cache.isNull():
+            self._rebuild_cache()
+        painter = QPainter(self)
+        # Restrict the blit to the damaged area
+        painter.setClipRect(event.rect())
+        painter.drawPixmap(0, 0, self._cache)
+        painter.end()
 
 
 class HomeScreen(QWidget):
@@ -122,6 +351,19 @@ class HomeScreen(QWidget):
     def __init__(self, app_instance):
         super().__init__()
         self.app_instance = app_instance
+        
+        # Logo rescaling state: cheap scales while resizing, one smooth
+        # scale once the size settles
+        self._last_scaled_size = None
+        self._logo_target = None
+        # Smooth scales are kept in the shared, LRU-evicted QPixmapCache
+        QPixmapCache.setCacheLimit(
+            max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_LIMIT_KB)
+        )
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.timeout.connect(self._do_smooth_rescale)
+        
         self.setup_ui()
         self.setup_animations()
         
@@ -134,13 +376,8 @@ class HomeScreen(QWidget):
         # Set up gradient background
         self.setup_gradient_background()
         
-        # Main layout - use absolute positioning for overlay effect
-        main_widget = QWidget()
-        main_widget.setParent(self)
-        main_widget.resize(self.size())
-        
         # Background logo that fills most of the screen
-        self.logo_label = QLabel(main_widget)
+        self.logo_label = QLabel()
         
         # Get the absolute path to the logo file
         current_file = Path(__file__)
@@ -148,92 +385,87 @@ class HomeScreen(QWidget):
         logo_path = (project_root / "assets" / "icons" /
                      "peregrine_ai_logo.jpeg")
         
-        print(f"Looking for logo at: {logo_path}")
-        print(f"Logo file exists: {os.path.exists(logo_path)}")
+        logo_exists = os.path.exists(logo_path)
+        logger.debug("Looking for logo at: %s (exists: %s)",
+                     logo_path, logo_exists)
         
-        if os.path.exists(logo_path):
+        if logo_exists:
             self.original_pixmap = QPixmap(str(logo_path))
-            print(f"Pixmap loaded: {not self.original_pixmap.isNull()}, " +
-                  f"size: {self.original_pixmap.size()}")
+            logger.debug("Pixmap loaded: %s, size: %s",
+                         not self.original_pixmap.isNull(),
+                         self.original_pixmap.size())
             
             if not self.original_pixmap.isNull():
-                # Scale the logo to fill most of the screen
-                scaled_pixmap = self.original_pixmap.scaled(
-                    700, 500,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self.logo_label.setPixmap(scaled_pixmap)
-                print("Logo image loaded successfully!")
+                # Scaled to fill most of the screen by the first resizeEvent,
+                # once the real size is known
+                logger.debug("Logo image loaded successfully!")
             else:
-                print("Failed to load pixmap from file")
+                logger.warning("Failed to load pixmap from file")
                 self.original_pixmap = None
                 self.logo_label.setText("🦅")
-                self.logo_label.setStyleSheet(
-                    "font-size: 200px; color: rgba(255, 255, 255, 0.8);"
-                )
+                self.logo_label.setStyleSheet(_LOGO_FALLBACK_QSS)
         else:
             # Fallback if image not found
-            print(f"Logo file not found at {logo_path}")
+            logger.warning(f"Logo file not found at {logo_path}")
             self.original_pixmap = None
             self.logo_label.setText("🦅")
-            self.logo_label.setStyleSheet(
-                "font-size: 200px; color: rgba(255, 255, 255, 0.8);"
-            )
+            self.logo_label.setStyleSheet(_LOGO_FALLBACK_QSS)
         
         self.logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.logo_label.setGeometry(50, 50, 700, 500)
+        # The pixmap is rescaled to fit, so it must not dictate the size
+        self.logo_label.setSizePolicy(QSizePolicy.Policy.Ignored,
+                                      QSizePolicy.Policy.Ignored)
         
         # Welcome text overlay at the top
         self.welcome_label = TypewriterLabel("Welcome to Peregrine Speak")
-        self.welcome_label.setParent(main_widget)
-        self.welcome_label.setGeometry(0, 30, 800, 50)
-        self.welcome_label.setStyleSheet("""
-            color: white;
-            font-size: 28px;
-            font-weight: bold;
-            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.7);
-            background: rgba(0, 0, 0, 0.3);
-            border-radius: 10px;
-            padding: 10px;
-        """)
+        self.welcome_label.setFixedHeight(50)
+        self.welcome_label.setStyleSheet(_WELCOME_QSS)
         
         # Start button overlay at the bottom
-        self.start_button = QPushButton("Start", main_widget)
-        self.start_button.setGeometry(350, 580, 200, 60)
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.95);
-                border: 2px solid rgba(100, 100, 100, 0.8);
-                border-radius: 30px;
-                font-size: 20px;
-                font-weight: bold;
-                color: #333;
-                padding: 15px 30px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 1.0);
-                border: 2px solid rgba(80, 80, 80, 1.0);
-                transform: scale(1.05);
-            }
-            QPushButton:pressed {
-                background: rgba(240, 240, 240, 1.0);
-            }
-        """)
+        self.start_button = QPushButton("Start")
+        self.start_button.setFixedSize(200, 60)
+        self.start_button.setStyleSheet(_START_BUTTON_QSS)
         self.start_button.clicked.connect(self.on_start_clicked)
         
+        # Overlay the three layers in one stacked layout so a resize is a
+        # single layout pass; each layer positions its widget with margins
+        logo_layer = QWidget()
+        logo_layout = QVBoxLayout(logo_layer)
+        logo_layout.setContentsMargins(*LOGO_MARGINS)
+        logo_layout.addWidget(self.logo_label)
+        
+        welcome_layer = QWidget()
+        welcome_layout = QVBoxLayout(welcome_layer)
+        welcome_layout.setContentsMargins(50, 20, 50, 0)
+        welcome_layout.addWidget(self.welcome_label)
+        welcome_layout.addStretch()
+        
+        button_layer = QWidget()
+        button_row = QHBoxLayout()
+        button_row.addStretch()
+        button_row.addWidget(self.start_button)
+        button_row.addStretch()
+        button_layout = QVBoxLayout(button_layer)
+        button_layout.setContentsMargins(0, 0, 0, 20)
+        button_layout.addStretch()
+        button_layout.addLayout(button_row)
+        
+        # Only the top (button) layer takes input
+        for layer in (logo_layer, welcome_layer):
+            layer.setAttribute(
+                Qt.WidgetAttribute.WA_TransparentForMouseEvents
+            )
+            
+        stack = QStackedLayout(self)
+        stack.setStackingMode(QStackedLayout.StackingMode.StackAll)
+        stack.addWidget(logo_layer)
+        stack.addWidget(welcome_layer)
+        stack.addWidget(button_layer)
+        stack.setCurrentWidget(button_layer)
+        
     def setup_gradient_background(self):
         """Set up the gradient background matching Peregrine colors."""
-        self.setStyleSheet("""
-            HomeScreen {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #a8e6cf,
-                    stop: 0.5 #7fcdcd,
-                    stop: 1 #6a5acd
-                );
-            }
-        """)
+        self.setStyleSheet(_HOME_SCREEN_QSS)
         
     def setup_animations(self):
         """Set up fade and other animations."""
@@ -283,31 +515,61 @@ class HomeScreen(QWidget):
         """Handle window resize to maintain responsive layout."""
         super().resizeEvent(event)
         
-        # Update positions and sizes based on new window size
-        width = self.width()
-        height = self.height()
-        
-        # Logo takes up most of the screen
-        logo_margin = 50
-        logo_width = width - (2 * logo_margin)
-        logo_height = height - 150  # Leave space for text and button
-        
-        self.logo_label.setGeometry(logo_margin, 80, logo_width, logo_height)
-        
-        # Welcome text at the top
-        self.welcome_label.setGeometry(50, 20, width - 100, 50)
-        
-        # Start button at the bottom center
-        button_width = 200
-        button_x = (width - button_width) // 2
-        button_y = height - 80
-        self.start_button.setGeometry(button_x, button_y, button_width, 60)
+        # Spurious resize (e.g. from a style refresh): nothing moves
+        if event.size() == event.oldSize():
+            return
+            
+        # The stacked layout places the widgets; only the logo pixmap
+        # needs rescaling for the area left inside the logo margins
+        left, top, right, bottom = LOGO_MARGINS
+        logo_width = self.width() - left - right
+        logo_height = self.height() - top - bottom
         
         # Re-scale the logo image if needed
         if hasattr(self, 'original_pixmap') and self.original_pixmap:
+            target = (logo_width - 50, logo_height - 50)
+            self._logo_target = target
+            if target == self._last_scaled_size:
+                return
+                
+            cached_pixmap = QPixmapCache.find(_logo_cache_key(target))
+            if cached_pixmap is not None and not cached_pixmap.isNull():
+                self.logo_label.setPixmap(cached_pixmap)
+                self._last_scaled_size = target
+                return
+                
+            # Before the first show there is no drag to keep up with, so
+            # scale smoothly straight away
+            if not self.isVisible():
+                self._do_smooth_rescale()
+                return
+                
+            # Nearest-neighbour while the window is being dragged; the
+            # smooth scale runs once resizing has been idle for 150 ms
+            self.logo_label.setPixmap(self.original_pixmap.scaled(
+                target[0], target[1],
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation
+            ))
+            # The label no longer shows a smooth scale of any size
+            self._last_scaled_size = None
+            self._smooth_timer.start(150)
+                
+    def _do_smooth_rescale(self):
+        """Smoothly scale the logo to the settled size, via the cache."""
+        target = self._logo_target
+        if target == self._last_scaled_size:
+            return
+            
+        key = _logo_cache_key(target)
+        scaled_pixmap = QPixmapCache.find(key)
+        if scaled_pixmap is None or scaled_pixmap.isNull():
             scaled_pixmap = self.original_pixmap.scaled(
-                logo_width - 50, logo_height - 50,
+                target[0], target[1],
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.SmoothTransformation
             )
-            self.logo_label.setPixmap(scaled_pixmap)
+            QPixmapCache.insert(key, scaled_pixmap)
+            
+        self.logo_label.setPixmap(scaled_pixmap)
+        self._last_scaled_size = target
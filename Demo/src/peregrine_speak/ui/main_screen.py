@@ -3,10 +3,78 @@ Main Screen for Peregrine Speak application with TTS functionality.
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QTextEdit, QLabel, QFrame, QGraphicsOpacityEffect)
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QIcon
+                             QTextEdit, QFrame, QGraphicsOpacityEffect)
+from PyQt6.QtCore import QPropertyAnimation, QEasingCurve
 from enum import Enum
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Stylesheets
+_MAIN_SCREEN_QSS = """
+    MainScreen {
+        background: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 1,
+            stop: 0 #f0f8ff,
+            stop: 0.5 #e6f3ff,
+            stop: 1 #ddeeff
+        );
+    }
+"""
+
+_CONTROL_FRAME_QSS = """
+    QFrame {
+        background: rgba(200, 200, 200, 0.3);
+        border-radius: 15px;
+        padding: 10px;
+    }
+    QFrame QPushButton {
+        background: rgba(100, 100, 100, 0.7);
+        border: none;
+        border-radius: 25px;
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QFrame QPushButton:hover {
+        background: rgba(100, 100, 100, 0.9);
+    }
+    QFrame QPushButton:pressed {
+        background: rgba(80, 80, 80, 0.9);
+    }
+"""
+
+_TEXT_EDIT_QSS = """
+    QTextEdit {
+        background: rgba(255, 255, 255, 0.9);
+        border: 2px solid rgba(150, 150, 150, 0.3);
+        border-radius: 10px;
+        padding: 15px;
+        font-size: 14px;
+        line-height: 1.5;
+    }
+    QTextEdit:focus {
+        border: 2px solid rgba(100, 150, 200, 0.6);
+    }
+"""
+
+_CLOSE_BUTTON_QSS = """
+    QPushButton {
+        background: rgba(200, 100, 100, 0.8);
+        border: none;
+        border-radius: 20px;
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 10px 20px;
+    }
+    QPushButton:hover {
+        background: rgba(200, 100, 100, 1.0);
+    }
+    QPushButton:pressed {
+        background: rgba(180, 80, 80, 1.0);
+    }
+"""
 
 
 class PlaybackSpeed(Enum):
@@ -16,12 +84,22 @@ class PlaybackSpeed(Enum):
     FASTER = (2.0, "x2")
 
 
+# Speed the speed button cycles to from each speed
+_NEXT_SPEED = {
+    PlaybackSpeed.NORMAL: PlaybackSpeed.FAST,
+    PlaybackSpeed.FAST: PlaybackSpeed.FASTER,
+    PlaybackSpeed.FASTER: PlaybackSpeed.NORMAL,
+}
+
+
 class MainScreen(QWidget):
     """Main screen widget with TTS controls and text input."""
     
     def __init__(self, app_instance):
         super().__init__()
         self.app_instance = app_instance
+        # Engine used by the transport buttons, resolved once
+        self._tts = app_instance.get_tts_engine()
         self.current_speed = PlaybackSpeed.NORMAL
         self.is_playing = False
         self.is_paused = False
@@ -35,16 +113,7 @@ class MainScreen(QWidget):
         self.resize(1000, 700)
         
         # Set gradient background
-        self.setStyleSheet("""
-            MainScreen {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #f0f8ff,
-                    stop: 0.5 #e6f3ff,
-                    stop: 1 #ddeeff
-                );
-            }
-        """)
+        self.setStyleSheet(_MAIN_SCREEN_QSS)
         
         # Main layout
         layout = QVBoxLayout()
@@ -68,13 +137,8 @@ class MainScreen(QWidget):
     def create_control_bar(self):
         """Create the control buttons bar."""
         control_frame = QFrame()
-        control_frame.setStyleSheet("""
-            QFrame {
-                background: rgba(200, 200, 200, 0.3);
-                border-radius: 15px;
-                padding: 10px;
-            }
-        """)
+        # One sheet for the frame and all of its buttons, parsed once
+        control_frame.setStyleSheet(_CONTROL_FRAME_QSS)
         control_frame.setMaximumHeight(80)
         
         layout = QHBoxLayout()
@@ -105,29 +169,6 @@ class MainScreen(QWidget):
         self.voice_button.setMinimumSize(80, 50)
         self.voice_button.clicked.connect(self.on_voice_clicked)
         
-        # Style all buttons
-        button_style = """
-            QPushButton {
-                background: rgba(100, 100, 100, 0.7);
-                border: none;
-                border-radius: 25px;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(100, 100, 100, 0.9);
-            }
-            QPushButton:pressed {
-                background: rgba(80, 80, 80, 0.9);
-            }
-        """
-        
-        for button in [self.play_button, self.pause_button,
-                       self.discard_button, self.speed_button,
-                       self.voice_button]:
-            button.setStyleSheet(button_style)
-        
         layout.addStretch()
         layout.addWidget(self.play_button)
         layout.addWidget(self.pause_button)
@@ -143,19 +184,7 @@ class MainScreen(QWidget):
         """Create the text input area."""
         self.text_edit = QTextEdit()
         self.text_edit.setPlaceholderText("Enter or paste your text here...")
-        self.text_edit.setStyleSheet("""
-            QTextEdit {
-                background: rgba(255, 255, 255, 0.9);
-                border: 2px solid rgba(150, 150, 150, 0.3);
-                border-radius: 10px;
-                padding: 15px;
-                font-size: 14px;
-                line-height: 1.5;
-            }
-            QTextEdit:focus {
-                border: 2px solid rgba(100, 150, 200, 0.6);
-            }
-        """)
+        self.text_edit.setStyleSheet(_TEXT_EDIT_QSS)
         self.text_edit.setMinimumHeight(300)
         
         return self.text_edit
@@ -167,23 +196,7 @@ class MainScreen(QWidget):
         
         self.close_button = QPushButton("Close App")
         self.close_button.setMinimumSize(120, 40)
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                background: rgba(200, 100, 100, 0.8);
-                border: none;
-                border-radius: 20px;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background: rgba(200, 100, 100, 1.0);
-            }
-            QPushButton:pressed {
-                background: rgba(180, 80, 80, 1.0);
-            }
-        """)
+        self.close_button.setStyleSheet(_CLOSE_BUTTON_QSS)
         self.close_button.clicked.connect(self.on_close_clicked)
         
         close_layout.addWidget(self.close_button)
@@ -216,19 +229,19 @@ class MainScreen(QWidget):
     def on_play_clicked(self):
         """Handle play button click."""
         text = self.text_edit.toPlainText().strip()
-        print(f"Play button clicked. Text length: {len(text)}")
+        logger.debug("Play button clicked. Text length: %d", len(text))
         
         if not text:
-            print("No text to speak!")
+            logger.debug("No text to speak!")
             return
             
         if self.is_paused:
             # Resume playback
-            print("Resuming TTS...")
+            logger.debug("Resuming TTS...")
             self.resume_tts()
         else:
             # Start new playback
-            print(f"Starting TTS with text: '{text[:50]}...'")
+            logger.debug("Starting TTS with text: '%s...'", text[:50])
             self.start_tts(text)
             
     def on_pause_clicked(self):
@@ -243,11 +256,7 @@ class MainScreen(QWidget):
         
     def on_speed_clicked(self):
         """Handle speed button click - cycle through speeds."""
-        speeds = list(PlaybackSpeed)
-        current_index = speeds.index(self.current_speed)
-        next_index = (current_index + 1) % len(speeds)
-        self.current_speed = speeds[next_index]
-        
+        self.current_speed = _NEXT_SPEED[self.current_speed]
         self.speed_button.setText(self.current_speed.value[1])
         
     def on_voice_clicked(self):
@@ -260,27 +269,23 @@ class MainScreen(QWidget):
         
     def start_tts(self, text):
         """Start text-to-speech synthesis."""
-        tts_engine = self.app_instance.get_tts_engine()
         speed = self.current_speed.value[0]
-        tts_engine.speak(text, speed)
+        self._tts.speak(text, speed)
         self.is_playing = True
         self.is_paused = False
         
     def pause_tts(self):
         """Pause text-to-speech synthesis."""
-        tts_engine = self.app_instance.get_tts_engine()
-        tts_engine.pause()
+        self._tts.pause()
         self.is_paused = True
         
     def resume_tts(self):
         """Resume text-to-speech synthesis."""
-        tts_engine = self.app_instance.get_tts_engine()
-        tts_engine.resume()
+        self._tts.resume()
         self.is_paused = False
         
     def stop_tts(self):
         """Stop text-to-speech synthesis."""
-        tts_engine = self.app_instance.get_tts_engine()
-        tts_engine.stop()
+        self._tts.stop()
         self.is_playing = False
         self.is_paused = False
@@ -3,98 +3,216 @@ Voice Selection dialog for Peregrine Speak application.
 """
 
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QLabel, QFrame, QScrollArea, QWidget)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+                             QLabel, QListView, QStyledItemDelegate, QStyle,
+                             QAbstractItemView)
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRectF, QSize
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen, QPixmap
+import logging
 
+logger = logging.getLogger(__name__)
 
-class VoiceItem(QFrame):
-    """Individual voice item widget."""
+# Stylesheets
+_DIALOG_QSS = """
+    VoiceSelection {
+        background: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 1,
+            stop: 0 #e6f3ff,
+            stop: 1 #ddeeff
+        );
+    }
+    VoiceSelection QPushButton {
+        background: rgba(100, 100, 100, 0.7);
+        border: none;
+        border-radius: 20px;
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 10px 20px;
+    }
+    VoiceSelection QPushButton:hover {
+        background: rgba(100, 100, 100, 0.9);
+    }
+    VoiceSelection QPushButton:pressed {
+        background: rgba(80, 80, 80, 0.9);
+    }
+    VoiceSelection QPushButton:disabled {
+        background: rgba(150, 150, 150, 0.5);
+        color: rgba(255, 255, 255, 0.5);
+    }
+"""
+
+_TITLE_QSS = """
+    font-size: 20px;
+    font-weight: bold;
+    color: #333;
+    padding: 10px;
+"""
+
+_VOICE_LIST_QSS = """
+    QListView {
+        border: none;
+        background: transparent;
+    }
+"""
+
+# Model roles for the voice list; the name is the display role
+LANGUAGE_ROLE = Qt.ItemDataRole.UserRole + 1
+FLAG_ROLE = Qt.ItemDataRole.UserRole + 2
+
+# Voice row colours
+_ROW_BACKGROUND = QColor(100, 100, 100, 178)
+_ROW_HOVER = QColor(120, 120, 120, 204)
+_ROW_SELECTED = QColor(100, 150, 200, 230)
+_ROW_SELECTED_BORDER = QColor(100, 150, 200, 255)
+
+# Rendered flag badges keyed by (emoji, size, device pixel ratio)
+_FLAG_CACHE = {}
+
+
+def _flag_pixmap(emoji, size, ratio):
+    """
+    Return the flag emoji drawn in a white circle, rendering it only once.
     
-    def __init__(self, voice_name, language, flag_emoji, parent_dialog):
-        super().__init__()
-        self.voice_name = voice_name
-        self.language = language
-        self.flag_emoji = flag_emoji
-        self.parent_dialog = parent_dialog
-        self.selected = False
+    Emoji rasterization is comparatively expensive, and every row repeats
+    one of a couple of flags, so rows blit a shared pixmap instead.
+    
+    Args:
+        emoji: Flag emoji to draw
+        size: Badge diameter in logical pixels
+        ratio: Device pixel ratio of the target surface
         
-        self.setup_ui()
+    Returns:
+        QPixmap: The badge, transparent outside the circle
+    """
+    key = (emoji, size, ratio)
+    pixmap = _FLAG_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
         
-    def setup_ui(self):
-        """Set up the voice item UI."""
-        self.setMinimumHeight(80)
-        self.setStyleSheet("""
-            VoiceItem {
-                background: rgba(100, 100, 100, 0.7);
-                border-radius: 10px;
-                margin: 5px;
-            }
-            VoiceItem:hover {
-                background: rgba(120, 120, 120, 0.8);
-            }
-        """)
-        
-        layout = QHBoxLayout()
-        layout.setContentsMargins(15, 10, 15, 10)
-        
-        # Flag icon
-        flag_label = QLabel(self.flag_emoji)
-        flag_label.setStyleSheet("""
-            font-size: 24px;
-            background: white;
-            border-radius: 15px;
-            padding: 5px;
-            min-width: 30px;
-            max-width: 30px;
-            min-height: 30px;
-            max-height: 30px;
-        """)
-        flag_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Voice name label
-        name_label = QLabel(self.voice_name)
-        name_label.setStyleSheet("""
-            color: white;
-            font-size: 16px;
-            font-weight: bold;
-            padding-left: 15px;
-        """)
-        
-        layout.addWidget(flag_label)
-        layout.addWidget(name_label)
-        layout.addStretch()
+        font = QFont()
+        font.setPixelSize(24)
+        badge = QRectF(0, 0, size, size)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(Qt.GlobalColor.white)
+        painter.drawEllipse(badge)
+        painter.setPen(Qt.GlobalColor.black)
+        painter.setFont(font)
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, emoji)
+        painter.end()
         
-        self.setLayout(layout)
+        _FLAG_CACHE[key] = pixmap
+    return pixmap
+
+
+class VoiceModel(QAbstractListModel):
+    """List model exposing voices as (name, language, flag) rows."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._voices = []
         
-    def mousePressEvent(self, event):
-        """Handle mouse press to select voice."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.parent_dialog.select_voice(self)
-            
-    def set_selected(self, selected):
-        """Set the selection state of this voice item."""
-        self.selected = selected
-        if selected:
-            self.setStyleSheet("""
-                VoiceItem {
-                    background: rgba(100, 150, 200, 0.9);
-                    border: 2px solid rgba(100, 150, 200, 1.0);
-                    border-radius: 10px;
-                    margin: 5px;
-                }
-            """)
+    def setVoices(self, voices):
+        """
+        Replace the listed voices.
+        
+        Args:
+            voices: Voice objects from the TTS engine
+        """
+        self.beginResetModel()
+        self._voices = [
+            # Map language to flag emoji
+            (voice.name, voice.language,
+             "🇺🇸" if "US" in voice.language else "🇬🇧")
+            for voice in voices
+        ]
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        """Number of voices; the list has no children."""
+        return 0 if parent.isValid() else len(self._voices)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return the name, language or flag of a voice row."""
+        if not index.isValid():
+            return None
+        name, language, flag = self._voices[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return name
+        if role == LANGUAGE_ROLE:
+            return language
+        if role == FLAG_ROLE:
+            return flag
+        return None
+
+
+class VoiceDelegate(QStyledItemDelegate):
+    """
+    Paints one voice row: a rounded card with a white flag circle and
+    the voice name.
+    
+    Rows are painted on demand for the visible part of the list, so no
+    widget tree is built per voice.
+    """
+    
+    ROW_HEIGHT = 80
+    MARGIN = 5
+    FLAG_SIZE = 40
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._name_font = QFont()
+        self._name_font.setPixelSize(16)
+        self._name_font.setBold(True)
+        
+    def sizeHint(self, option, index):
+        """Fixed row height, including the card margin."""
+        return QSize(option.rect.width(), self.ROW_HEIGHT + 2 * self.MARGIN)
+        
+    def paint(self, painter, option, index):
+        """Paint a single voice row."""
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Card background
+        card = QRectF(option.rect).adjusted(
+            self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN
+        )
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(QPen(_ROW_SELECTED_BORDER, 2))
+            painter.setBrush(_ROW_SELECTED)
         else:
-            self.setStyleSheet("""
-                VoiceItem {
-                    background: rgba(100, 100, 100, 0.7);
-                    border-radius: 10px;
-                    margin: 5px;
-                }
-                VoiceItem:hover {
-                    background: rgba(120, 120, 120, 0.8);
-                }
-            """)
+            painter.setPen(Qt.PenStyle.NoPen)
+            if option.state & QStyle.StateFlag.State_MouseOver:
+                painter.setBrush(_ROW_HOVER)
+            else:
+                painter.setBrush(_ROW_BACKGROUND)
+        painter.drawRoundedRect(card, 10, 10)
+        
+        # Flag icon in a white circle
+        flag_rect = QRectF(card.left() + 15,
+                           card.center().y() - self.FLAG_SIZE / 2,
+                           self.FLAG_SIZE, self.FLAG_SIZE)
+        ratio = painter.device().devicePixelRatioF()
+        painter.drawPixmap(
+            flag_rect.topLeft(),
+            _flag_pixmap(index.data(FLAG_ROLE), self.FLAG_SIZE, ratio)
+        )
+        
+        # Voice name
+        name_rect = card.adjusted(flag_rect.right() - card.left() + 15, 0,
+                                  -15, 0)
+        painter.setPen(Qt.GlobalColor.white)
+        painter.setFont(self._name_font)
+        painter.drawText(name_rect,
+                         Qt.AlignmentFlag.AlignLeft |
+                         Qt.AlignmentFlag.AlignVCenter,
+                         index.data(Qt.ItemDataRole.DisplayRole))
+        
+        painter.restore()
 
 
 class VoiceSelection(QDialog):
@@ -104,7 +222,6 @@ class VoiceSelection(QDialog):
         super().__init__()
         self.app_instance = app_instance
         self.selected_voice = None
-        self.voice_items = []
         
         self.setup_ui()
         self.setup_voices()
@@ -115,16 +232,8 @@ class VoiceSelection(QDialog):
         self.setModal(True)
         self.resize(400, 500)
         
-        # Set gradient background
-        self.setStyleSheet("""
-            VoiceSelection {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 #e6f3ff,
-                    stop: 1 #ddeeff
-                );
-            }
-        """)
+        # Gradient background and dialog button style in one sheet
+        self.setStyleSheet(_DIALOG_QSS)
         
         layout = QVBoxLayout()
         layout.setSpacing(20)
@@ -133,32 +242,30 @@ class VoiceSelection(QDialog):
         # Title
         title_label = QLabel("Choose Voice")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            font-size: 20px;
-            font-weight: bold;
-            color: #333;
-            padding: 10px;
-        """)
+        title_label.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title_label)
         
-        # Scroll area for voices
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-        """)
-        
-        # Container for voice items
-        self.voices_container = QWidget()
-        self.voices_layout = QVBoxLayout()
-        self.voices_layout.setSpacing(10)
-        self.voices_container.setLayout(self.voices_layout)
-        
-        scroll_area.setWidget(self.voices_container)
-        layout.addWidget(scroll_area)
+        # Voice list; rows are painted by the delegate
+        self.voice_model = VoiceModel(self)
+        self.voice_list = QListView()
+        self.voice_list.setModel(self.voice_model)
+        self.voice_list.setItemDelegate(VoiceDelegate(self.voice_list))
+        self.voice_list.setSelectionMode(
+            QAbstractItemView.SelectionMode.SingleSelection
+        )
+        self.voice_list.setVerticalScrollMode(
+            QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
+        self.voice_list.setMouseTracking(True)
+        # Every row has the delegate's fixed height, so the view lays out
+        # from one size hint instead of querying each row
+        self.voice_list.setUniformItemSizes(True)
+        self.voice_list.setSpacing(5)
+        self.voice_list.setStyleSheet(_VOICE_LIST_QSS)
+        self.voice_list.selectionModel().currentChanged.connect(
+            self.on_current_voice_changed
+        )
+        layout.addWidget(self.voice_list)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -174,32 +281,6 @@ class VoiceSelection(QDialog):
         self.select_button.setEnabled(False)
         self.select_button.clicked.connect(self.accept_selection)
         
-        # Style buttons
-        button_style = """
-            QPushButton {
-                background: rgba(100, 100, 100, 0.7);
-                border: none;
-                border-radius: 20px;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background: rgba(100, 100, 100, 0.9);
-            }
-            QPushButton:pressed {
-                background: rgba(80, 80, 80, 0.9);
-            }
-            QPushButton:disabled {
-                background: rgba(150, 150, 150, 0.5);
-                color: rgba(255, 255, 255, 0.5);
-            }
-        """
-        
-        cancel_button.setStyleSheet(button_style)
-        self.select_button.setStyleSheet(button_style)
-        
         button_layout.addStretch()
         button_layout.addWidget(cancel_button)
         button_layout.addWidget(self.select_button)
@@ -212,36 +293,20 @@ class VoiceSelection(QDialog):
         # Get voices from TTS engine
         tts_engine = self.app_instance.get_tts_engine()
         voices = tts_engine.get_available_voices()
+        self.voice_model.setVoices(voices)
         
-        # Create UI items for each voice
-        for voice in voices:
-            # Map language to flag emoji
-            flag_emoji = "🇺🇸" if "US" in voice.language else "🇬🇧"
-            voice_item = VoiceItem(
-                voice.name, voice.language, flag_emoji, self
-            )
-            self.voice_items.append(voice_item)
-            self.voices_layout.addWidget(voice_item)
-            
-        # Add stretch to push items to top
-        self.voices_layout.addStretch()
-        
-    def select_voice(self, voice_item):
-        """Select a voice item."""
-        # Deselect all other voices
-        for item in self.voice_items:
-            item.set_selected(False)
-            
-        # Select the clicked voice
-        voice_item.set_selected(True)
-        self.selected_voice = voice_item
+    def on_current_voice_changed(self, current, previous):
+        """Track the voice under the list's current index."""
+        if not current.isValid():
+            return
+        self.selected_voice = current.data(Qt.ItemDataRole.DisplayRole)
         self.select_button.setEnabled(True)
         
     def accept_selection(self):
         """Accept the selected voice."""
         if self.selected_voice:
-            voice_name = self.selected_voice.voice_name
-            print(f"Selected voice: {voice_name}")
+            voice_name = self.selected_voice
+            logger.debug("Selected voice: %s", voice_name)
             
             # Apply voice selection to TTS engine
             tts_engine = self.app_instance.get_tts_engine()
@@ -251,4 +316,4 @@ class VoiceSelection(QDialog):
             
     def get_selected_voice(self):
         """Get the currently selected voice."""
-        return self.selected_voice.voice_name if self.selected_voice else None
+        return self.selected_voice
@@ -1,69 +1,342 @@
 #!/usr/bin/env python3
 """
 Test script for Kokoro TTS integration.
+
+Runs under pytest, where the engine is a session fixture, or directly as a
+script.
 """
 
 import sys
 import os
+import json
+import asyncio
+import time
+import traceback
+import functools
 
-# Add the src path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import pytest
 
-from peregrine_speak.tts.kokoro_engine import KokoroEngine
+try:
+    from peregrine_speak.tts.kokoro_engine import KokoroEngine
+except ImportError:
+    # Run as a script: conftest.py next to this file adds src to the path
+    import conftest  # noqa: F401
+    from peregrine_speak.tts.kokoro_engine import KokoroEngine
+from peregrine_speak.tts.request_pool import KokoroRequestPool
 
 
-def test_kokoro_engine():
-    """Test the Kokoro TTS engine."""
-    print("Testing Kokoro TTS Engine...")
+# Real-time factor (synthesis time / audio duration) the stream must beat;
+# PEREGRINE_RTF_SLO overrides the per-device default
+RTF_SLO_CPU = 0.5
+RTF_SLO_GPU = 0.1
+
+# When set, timing results are appended to this JSON-lines file for trends
+PERF_LOG_PATH = os.environ.get("PEREGRINE_PERF_JSON")
+
+
+def rtf_slo(engine: KokoroEngine) -> float:
+    """Real-time factor SLO for the engine's device, or PEREGRINE_RTF_SLO."""
+    default_slo = RTF_SLO_GPU if engine.cuda_available else RTF_SLO_CPU
+    return float(os.environ.get("PEREGRINE_RTF_SLO", default_slo))
+
+
+def log(**fields):
+    """Print one JSON record, stamped with a perf counter, for CI parsing."""
+    print(json.dumps({"ts_ns": time.perf_counter_ns(), **fields}))
+
+
+@functools.lru_cache(maxsize=None)
+def get_engine() -> KokoroEngine:
+    """Return the process-wide engine, loading the model on first use."""
+    return KokoroEngine.instance()
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Engine shared by every test in the session; loaded only once."""
+    shared = get_engine()
+    yield shared
+    shared.cleanup()
+
+
+def check_kokoro_engine(engine: KokoroEngine) -> bool:
+    """
+    Exercise voice listing and synthesis on an initialized engine.
     
-    # Initialize the engine
-    engine = KokoroEngine()
+    Args:
+        engine: Engine to test
+        
+    Returns:
+        bool: True if every check passed
+    """
+    log(event="engine_test_start")
     
     if not engine.is_initialized:
-        print("❌ Engine failed to initialize")
+        log(event="engine_init_failed")
         return False
         
-    print("✅ Engine initialized successfully")
+    log(event="engine_init_ok")
     
     # Test voice listing
     voices = engine.get_available_voices()
-    print(f"📢 Found {len(voices)} voices:")
-    for voice in voices:
-        print(f"  - {voice.name} ({voice.language}, {voice.gender})")
-        
+    log(event="voices", count=len(voices),
+        voices=[{"name": voice.name, "language": voice.language,
+                 "gender": voice.gender} for voice in voices])
+    
     if not voices:
-        print("❌ No voices available")
+        log(event="voices_missing")
         return False
         
     # Test synthesis
     test_text = "Hello! This is a test of the Kokoro TTS engine."
-    print(f"\n🗣️ Testing synthesis with text: '{test_text}'")
+    log(event="synthesis_start", text=test_text)
     
     try:
         engine.speak(test_text, speed=1.0)
-        print("✅ Synthesis started successfully")
-        
-        # Wait a bit for synthesis to complete
-        import time
-        time.sleep(2)
+        log(event="synthesis_queued")
         
+        # Wait for synthesis and playback to finish
+        if not engine.wait_until_idle(timeout=30):
+            log(event="synthesis_timeout")
+            return False
+            
         return True
         
     except Exception as e:
-        print(f"❌ Synthesis failed: {e}")
-        import traceback
-        traceback.print_exc()
+        log(event="synthesis_failed", error=str(e))
+        tb = traceback.TracebackException.from_exception(e, limit=10)
+        sys.stderr.write("".join(tb.format()))
+        return False
+
+
+# Utterances for the batch synthesis check
+BATCH_TEXTS = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Peregrine falcons are the fastest birds alive.",
+    "Text to speech turns written words into audio.",
+    "This sentence is part of a batch.",
+    "Short one.",
+    "Kokoro synthesizes speech at twenty four kilohertz.",
+]
+
+# Batch sizes the batch synthesis test sweeps
+BATCH_SIZES = (1, 4, 16)
+
+
+def check_batch_synthesis(engine: KokoroEngine,
+                          batch: int = len(BATCH_TEXTS)) -> bool:
+    """
+    Synthesize several utterances in one call and check each has audio.
+    
+    The real-time factor of the whole call is logged and must meet the
+    same SLO as streaming synthesis.
+    
+    Args:
+        engine: Engine to test
+        batch: Number of utterances, cycling through BATCH_TEXTS
+        
+    Returns:
+        bool: True if every utterance produced samples and the real-time
+        factor met the SLO
+    """
+    texts = [BATCH_TEXTS[i % len(BATCH_TEXTS)] for i in range(batch)]
+    log(event="batch_start", count=batch)
+    
+    # Compile and run the batch path once, untimed, so the measurement
+    # below doesn't include compilation or waiting on the warm-up
+    engine.warmup()
+    engine.synthesize_batch(texts[:1], speed=1.0)
+    log(event="batch_warmed_up", count=batch)
+    
+    start_ns = time.perf_counter_ns()
+    outputs = engine.synthesize_batch(texts, speed=1.0)
+    total_ns = time.perf_counter_ns() - start_ns
+    if len(outputs) != batch or not all(map(len, outputs)):
+        log(event="batch_empty", count=batch)
+        return False
+        
+    audio_seconds = sum(map(len, outputs)) / engine.sample_rate
+    rtf = total_ns / 1e9 / audio_seconds
+    slo = rtf_slo(engine)
+    log(event="batch_timing", count=batch, total_ns=total_ns,
+        audio_seconds=audio_seconds, rtf=rtf, slo=slo)
+    if rtf >= slo:
+        log(event="batch_slo_missed", count=batch, rtf=rtf, slo=slo)
+        return False
+        
+    log(event="batch_ok", count=batch)
+    return True
+
+
+def check_streaming(engine: KokoroEngine) -> bool:
+    """
+    Stream an utterance and check its real-time factor against the SLO.
+    
+    The stream only synthesizes, so unlike speak() its wall time isn't
+    bounded below by playback and measures synthesis speed directly.
+    
+    Args:
+        engine: Engine to test
+        
+    Returns:
+        bool: True if audio arrived, the last frame was flagged final and
+        the real-time factor met the SLO
+    """
+    text = "Streaming lets the first words play before the rest is ready."
+    log(event="stream_start", text=text)
+    
+    # Compile and run the stream path once, untimed, so the measurement
+    # below sees the cached graphs rather than first-call compilation
+    engine.warmup()
+    for _ in engine.stream("Warm up.", speed=1.0):
+        pass
+    log(event="stream_warmed_up")
+    
+    start_ns = time.perf_counter_ns()
+    first_audio_ns = None
+    total_bytes = 0
+    final = False
+    for pcm, is_final in engine.stream(text, speed=1.0):
+        if pcm and first_audio_ns is None:
+            first_audio_ns = time.perf_counter_ns() - start_ns
+        total_bytes += len(pcm)
+        final = is_final
+    total_ns = time.perf_counter_ns() - start_ns
+    
+    if first_audio_ns is None or not final:
+        log(event="stream_empty")
+        return False
+        
+    audio_seconds = total_bytes / 2 / engine.sample_rate
+    rtf = total_ns / 1e9 / audio_seconds
+    slo = rtf_slo(engine)
+    record = {
+        "test": "streaming",
+        "device": "cuda" if engine.cuda_available else "cpu",
+        "ttfa_ns": first_audio_ns,
+        "total_ns": total_ns,
+        "audio_seconds": audio_seconds,
+        "rtf": rtf,
+    }
+    log(event="stream_timing", slo=slo, **record)
+    
+    if PERF_LOG_PATH:
+        with open(PERF_LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+            
+    if rtf >= slo:
+        log(event="stream_slo_missed", rtf=rtf, slo=slo)
         return False
         
+    log(event="stream_slo_met", rtf=rtf, slo=slo)
+    return True
+
+
+async def check_async_speak(engine: KokoroEngine) -> bool:
+    """
+    Overlap voice listing, warm-up and tokenization, then stream async.
+    
+    The three preparation steps are independent, so they run concurrently
+    on the default executor before the utterance is synthesized.
+    
+    Args:
+        engine: Engine to test
+        
+    Returns:
+        bool: True if every step succeeded and audio was produced
+    """
+    text = "Asynchronous synthesis keeps the event loop free."
+    log(event="async_start", text=text)
+    
+    loop = asyncio.get_running_loop()
+    voices, warmed, phonemes = await asyncio.gather(
+        loop.run_in_executor(None, engine.get_available_voices),
+        loop.run_in_executor(None, engine.warmup),
+        loop.run_in_executor(None, engine.tokenize, text),
+    )
+    if not voices or not warmed or not phonemes:
+        log(event="async_prepare_failed")
+        return False
+        
+    total_bytes = 0
+    async for pcm in engine.speak_async(text, speed=1.0):
+        total_bytes += len(pcm)
+    if not total_bytes:
+        log(event="async_empty")
+        return False
+        
+    log(event="async_ok",
+        audio_seconds=total_bytes / 2 / engine.sample_rate)
+    return True
+
+
+async def check_request_pool(engine: KokoroEngine) -> bool:
+    """
+    Submit concurrent requests through a request pool and await them.
+    
+    Args:
+        engine: Engine the pool synthesizes with
+        
+    Returns:
+        bool: True if every pooled request produced audio
+    """
+    log(event="pool_start", count=len(BATCH_TEXTS))
+    pool = KokoroRequestPool(engine)
+    try:
+        outputs = await asyncio.gather(*(
+            asyncio.wrap_future(pool.add(text)) for text in BATCH_TEXTS
+        ))
     finally:
-        engine.cleanup()
+        pool.close()
+        
+    if not all(map(len, outputs)):
+        log(event="pool_empty")
+        return False
+        
+    log(event="pool_ok")
+    return True
+
+
+def test_kokoro_engine(engine):
+    """Test the Kokoro TTS engine."""
+    assert check_kokoro_engine(engine)
+
+
+def test_kokoro_streaming(engine):
+    """Test progressive streaming synthesis."""
+    assert engine.is_initialized
+    assert check_streaming(engine)
+
+
+def test_kokoro_async_speak(engine):
+    """Test concurrent preparation and async streaming synthesis."""
+    assert engine.is_initialized
+    assert asyncio.run(check_async_speak(engine))
+
+
+def test_kokoro_request_pool(engine):
+    """Test concurrent requests served through the request pool."""
+    assert engine.is_initialized
+    assert asyncio.run(check_request_pool(engine))
+
+
+@pytest.mark.parametrize("batch", BATCH_SIZES)
+def test_kokoro_batch_synthesis(engine, batch):
+    """Test batch synthesis without playback at several batch sizes."""
+    assert engine.is_initialized
+    assert check_batch_synthesis(engine, batch)
 
 
 if __name__ == "__main__":
-    success = test_kokoro_engine()
-    if success:
-        print("\n🎉 Kokoro TTS test completed successfully!")
-    else:
-        print("\n❌ Kokoro TTS test failed!")
-    
+    shared_engine = get_engine()
+    try:
+        success = (check_kokoro_engine(shared_engine)
+                   and check_streaming(shared_engine)
+                   and asyncio.run(check_async_speak(shared_engine))
+                   and check_batch_synthesis(shared_engine)
+                   and asyncio.run(check_request_pool(shared_engine)))
+    finally:
+        shared_engine.cleanup()
+        
+    log(event="test_passed" if success else "test_failed")
     sys.exit(0 if success else 1)